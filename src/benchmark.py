@@ -0,0 +1,108 @@
+# Benchmarks for misura.
+
+import tracemalloc
+from time import perf_counter
+
+from colorama import Style
+from misura.quantities import batchConvert, quantity
+
+COUNT = 100000
+
+
+class dictQuantity:
+    """
+    Previous quantity layout: an instance dictionary holding
+    the value, the uncertainty and the per-instance units and dimensions.
+    """
+
+    def __init__(self, qnt: quantity) -> None:
+        self.value = qnt.value
+        self.uncertainty = qnt.uncertainty
+        self.units = qnt.units
+        self.convertible = qnt.convertible
+        self.dimensions = qnt.dimensions
+
+
+def timing(run, repeat: int = 5) -> float:
+    """
+    Returns the best time of run, in seconds.
+    """
+
+    times = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        times.append(perf_counter() - start)
+
+    return min(times)
+
+
+def footprint(build) -> float:
+    """
+    Returns the bytes allocated per object built by build.
+    """
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    objects = [build(index) for index in range(COUNT)]
+
+    # Values and the list itself are included for both layouts.
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    del objects
+    return size / COUNT
+
+
+print("Benchmarks for {}.".format(Style.BRIGHT + "misura" + Style.RESET_ALL))
+
+# Memory.
+print("\nMEMORY BENCHMARKS.\n")
+
+for unit in ("m", "kg m s-2", "J mol-1 K-1"):
+    sample = quantity(1.0, unit)
+
+    before = footprint(lambda index: dictQuantity(quantity(float(index), unit)))
+    after = footprint(lambda index: quantity(float(index), unit))
+
+    print(
+        "{}: {:.0f} bytes per quantity, {:.0f} before ({:.1f}x).".format(
+            sample.unit(), after, before, before / after
+        )
+    )
+
+# Conversion.
+print("\nCONVERSION BENCHMARKS.\n")
+
+units = ("km", "cm", "mm", "m")
+items = [quantity(float(index), units[index % 4], 0.1) for index in range(COUNT)]
+
+loop = timing(lambda: [item.cto("m") for item in items])
+batch = timing(lambda: batchConvert(items, "m"))
+
+print("Per-item loop: {:.3f} s for {} quantities.".format(loop, COUNT))
+print("Batch, list: {:.3f} s ({:.1f}x).".format(batch, loop / batch))
+
+try:
+    import numpy  # noqa: F401
+
+    array = timing(lambda: batchConvert(items, "m", array=True))
+    print("Batch, array: {:.3f} s ({:.1f}x).".format(array, loop / array))
+
+except ImportError:
+    pass
+
+# Arithmetic.
+print("\nARITHMETIC BENCHMARKS.\n")
+
+first = quantity(2.0, "kg m", 0.1)
+second = quantity(300.0, "cm s-2", 1.0)
+
+for name, run in (
+    ("Multiplication", lambda: [first * second for _ in range(COUNT)]),
+    ("Division", lambda: [first / second for _ in range(COUNT)]),
+    ("Power", lambda: [first**2 for _ in range(COUNT)]),
+):
+    print("{}: {:.3f} s for {} operations.".format(name, timing(run), COUNT))
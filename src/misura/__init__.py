@@ -1,4 +1,3 @@
-from os import makedirs
 from os.path import expanduser
 
 from colorama import init
@@ -9,11 +8,8 @@ init()
 
 # Safe place to store currency exchange rates.
 # Set to $HOME/.misura/misura.json.
-currencies.path = expanduser("~") + "/.misura/"
-
-# Creates the directory ".misura" and defines the full path.
-makedirs(currencies.path, exist_ok=True)
-currencies.path += "misura.json"
+# The directory is created on the first rates' download.
+currencies.path = expanduser("~") + "/.misura/misura.json"
 
 # Removes init imports.
-del makedirs, currencies, init
+del expanduser, currencies, init
@@ -0,0 +1,841 @@
+# Arrays.
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from .exceptions import (
+    ConversionError,
+    InitError,
+    MixingError,
+    QuantityError,
+    UncertaintyComparisonError,
+)
+from .globals import logic, style
+from .quantities import ARRAYS, compatible, conversion, quantity
+from .tables import REGISTRY
+from .utilities import parseUnit, signature
+from .utilities import unitFromDict as ufd
+
+"""
+Array-backed quantities.
+
+Requires numpy.
+"""
+
+
+class quantityArray(np.lib.mixins.NDArrayOperatorsMixin):
+    """
+    misura's quantity array class.
+
+    Holds a numpy value buffer, an optional uncertainty buffer and a single unit for the whole array.
+    Units are checked once per operation, values and uncertainties are computed by numpy.
+    """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        # Subclasses take over mixed operations with quantities too.
+        super().__init_subclass__(**kwargs)
+        ARRAYS.add(cls)
+
+    def __init__(self, value: Any, unit: str = "", uncertainty: Any = None) -> None:
+        """
+        Quantity array initialization.
+
+        - value: Array-like of numbers.
+        - unit: A properly formatted string including all the units with their exponents. e.g. "m s-1".
+        - uncertainty: Optional array-like of uncertainties, broadcastable to value.
+        """
+
+        try:
+            assert isinstance(unit, str)
+
+            value = np.asarray(value)
+
+            if uncertainty is not None:
+                uncertainty = np.broadcast_to(uncertainty, value.shape).copy()
+                assert np.all(uncertainty >= 0)
+
+        except (AssertionError, ValueError):
+            raise InitError(value, unit, uncertainty)
+
+        self.value: np.ndarray = value
+        self.uncertainty: np.ndarray = uncertainty
+        self.signature: signature = parseUnit(unit)
+
+        # Checks currencies.
+        if REGISTRY.describeUnits(self.signature)[3]:
+            raise MixingError()
+
+    @classmethod
+    def fromSignature(
+        cls, value: np.ndarray, sig: signature, uncertainty: Any = None
+    ) -> quantityArray:
+        """
+        Builds a quantity array from already validated parts, skipping every check.
+        """
+
+        arr = object.__new__(cls)
+
+        arr.value = value
+        arr.uncertainty = uncertainty
+        arr.signature = sig
+
+        return arr
+
+    # UNITS.
+
+    @property
+    def units(self) -> dict:
+        return dict(self.signature.units)
+
+    @property
+    def convertible(self) -> bool:
+        return REGISTRY.describeUnits(self.signature)[1]
+
+    @property
+    def dimensions(self) -> dict:
+        return dict(REGISTRY.describeUnits(self.signature)[2])
+
+    # Printers are shared with quantities.
+    unit = quantity.unit
+    dimension = quantity.dimension
+
+    # STRINGS.
+
+    def __str__(self) -> str:
+        unit = self.unit(print=True)
+
+        return "{}{}{}".format(
+            self.value,
+            (
+                "{}{}".format(style.quantityPlusMinus, self.uncertainty)
+                if self.uncertainty is not None
+                else ""
+            ),
+            (" " + unit) if self.signature.units else "",
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    # CONTAINER.
+
+    @property
+    def shape(self) -> tuple:
+        return self.value.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.value.ndim
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, index: Any) -> Any:
+        return result(
+            self.value[index],
+            self.signature,
+            self.uncertainty[index] if self.uncertainty is not None else None,
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        return np.asarray(self.value, dtype=dtype)
+
+    # CONVERSION.
+
+    def cto(
+        self, targets: str, partial: bool = False, un_pack: bool = True
+    ) -> quantityArray:  # Convert to.
+        factor, sig = conversion(self, targets, partial, un_pack)
+
+        return quantityArray.fromSignature(
+            self.value * factor,
+            sig,
+            self.uncertainty * factor if self.uncertainty is not None else None,
+        )
+
+    # NUMPY.
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs, **kwargs) -> Any:
+        if method != "__call__" or "out" in kwargs:
+            return NotImplemented
+
+        if ufunc not in UFUNCS:
+            return NotImplemented
+
+        return UFUNCS[ufunc](ufunc, [operand(item) for item in inputs], kwargs)
+
+    def __array_function__(self, func: Any, types: tuple, args: tuple, kwargs: dict):
+        if func not in FUNCTIONS:
+            return NotImplemented
+
+        return FUNCTIONS[func](*args, **kwargs)
+
+
+# Operands.
+
+
+class operand:
+    """
+    Uniform view over quantity arrays, quantities and plain numbers.
+    """
+
+    __slots__ = ("value", "uncertainty", "signature", "source")
+
+    def __init__(self, item: Any) -> None:
+        self.source: Any = item
+
+        if isinstance(item, (quantityArray, quantity)):
+            self.value = np.asarray(item.value)
+            self.signature = item.signature
+
+            # Quantities always carry an uncertainty, possibly zero.
+            uncertainty = item.uncertainty
+            self.uncertainty = (
+                np.asarray(uncertainty)
+                if uncertainty is not None and np.any(uncertainty)
+                else None
+            )
+
+        else:
+            self.value = np.asarray(item)
+            self.signature = EMPTY
+            self.uncertainty = None
+
+    def quantity(self) -> Any:
+        """
+        Returns the operand as a quantity-like object for errors and conversions.
+        """
+
+        if isinstance(self.source, (quantityArray, quantity)):
+            return self.source
+
+        return quantityArray.fromSignature(self.value, EMPTY)
+
+    @property
+    def convertible(self) -> bool:
+        return REGISTRY.describeUnits(self.signature)[1]
+
+    @property
+    def units(self) -> dict:
+        return dict(self.signature.units)
+
+    def unit(self) -> str:
+        return self.signature.unit
+
+    def scaled(self, factor: float) -> operand:
+        if factor != 1:
+            self.value = self.value * factor
+
+            if self.uncertainty is not None:
+                self.uncertainty = self.uncertainty * factor
+
+        return self
+
+
+def aligned(first: operand, other: operand, symbol: str) -> operand:
+    """
+    Converts other to first's unit, raises QuantityError on incompatible units.
+    """
+
+    if first.signature == other.signature:
+        return other
+
+    if not first.signature.units or not other.signature.units:
+        raise QuantityError(first.quantity(), other.quantity(), symbol)
+
+    if not compatible(first, other):
+        if first.quantity().convertible and other.quantity().convertible:
+            raise ConversionError(other.quantity(), first.unit())
+
+        raise QuantityError(first.quantity(), other.quantity(), symbol)
+
+    return other.scaled(conversion(other.quantity(), first.unit())[0])
+
+
+def result(value: Any, sig: signature, uncertainty: Any) -> Any:
+    """
+    Wraps an operation's result, single elements are quantities.
+    """
+
+    if np.ndim(value) == 0:
+        value = np.asarray(value).item()
+
+        return quantity.fromSignature(
+            value,
+            sig,
+            np.asarray(uncertainty).item() if uncertainty is not None else 0 * value,
+        )
+
+    return quantityArray.fromSignature(value, sig, uncertainty)
+
+
+def combined(*terms: Any) -> Any:
+    """
+    Returns the quadrature sum of the uncertainty terms, None if there are none.
+    """
+
+    terms = [term for term in terms if term is not None]
+
+    if not terms:
+        return None
+
+    return np.sqrt(sum(np.square(term) for term in terms))
+
+
+# Kernels.
+
+
+def additive(ufunc: np.ufunc, inputs: list, kwargs: dict) -> quantityArray:
+    """
+    Addition and subtraction, operands share the first one's unit.
+    """
+
+    first, other = inputs
+    other = aligned(first, other, SYMBOLS.get(ufunc, ufunc.__name__))
+
+    return result(
+        ufunc(first.value, other.value, **kwargs),
+        first.signature,
+        combined(first.uncertainty, other.uncertainty),
+    )
+
+
+def selective(ufunc: np.ufunc, inputs: list, kwargs: dict) -> quantityArray:
+    """
+    Maximum and minimum, the uncertainty follows the selected element.
+    """
+
+    first, other = inputs
+    other = aligned(first, other, ufunc.__name__)
+
+    value = ufunc(first.value, other.value, **kwargs)
+    uncertainty = None
+
+    if first.uncertainty is not None or other.uncertainty is not None:
+        uncertainty = np.where(
+            value == first.value,
+            first.uncertainty if first.uncertainty is not None else 0,
+            other.uncertainty if other.uncertainty is not None else 0,
+        )
+
+    return result(value, first.signature, uncertainty)
+
+
+def comparison(ufunc: np.ufunc, inputs: list, kwargs: dict) -> np.ndarray:
+    """
+    Comparisons, returning plain boolean arrays.
+    """
+
+    first, other = inputs
+    symbol = SYMBOLS.get(ufunc, ufunc.__name__)
+    other = aligned(first, other, symbol)
+
+    if (
+        first.uncertainty is not None or other.uncertainty is not None
+    ) and not logic.ignoreUncertainty:
+        raise UncertaintyComparisonError(first.quantity(), other.quantity(), symbol)
+
+    return ufunc(first.value, other.value, **kwargs)
+
+
+def multiplicative(ufunc: np.ufunc, inputs: list, kwargs: dict) -> quantityArray:
+    """
+    Multiplication and division, units are merged.
+    """
+
+    first, other = inputs
+    sign = 1 if ufunc is np.multiply else -1
+
+    # Converts other's units of the same families as first's ones.
+    if first.convertible and other.convertible and other.signature.units:
+        factor, sig = conversion(other.quantity(), first.unit(), partial=True)
+        other = other.scaled(factor)
+        other.signature = sig
+
+    units = first.units
+
+    for u, power in other.signature.units:
+        units[u] = units.get(u, 0) + sign * power
+
+    value = ufunc(first.value, other.value, **kwargs)
+
+    # Relative uncertainties add in quadrature.
+    uncertainty = combined(
+        (
+            first.uncertainty * (other.value if sign > 0 else 1 / other.value)
+            if first.uncertainty is not None
+            else None
+        ),
+        (
+            other.uncertainty * first.value
+            if other.uncertainty is not None and sign > 0
+            else None
+        ),
+        (
+            other.uncertainty * first.value / other.value**2
+            if other.uncertainty is not None and sign < 0
+            else None
+        ),
+    )
+
+    return result(value, parseUnit(ufd(units)), uncertainty)
+
+
+def powered(ufunc: np.ufunc, inputs: list, kwargs: dict) -> quantityArray:
+    """
+    Powers by dimensionless exponents.
+    """
+
+    first, other = inputs
+
+    if other.signature.units:
+        raise QuantityError(first.quantity(), other.quantity(), "**")
+
+    value = ufunc(first.value, other.value, **kwargs)
+
+    # Dimensionless bases allow any exponent.
+    if not first.signature.units:
+        return result(
+            value,
+            EMPTY,
+            combined(
+                (
+                    np.abs(other.value * first.value ** (other.value - 1))
+                    * first.uncertainty
+                    if first.uncertainty is not None
+                    else None
+                ),
+                (
+                    np.abs(np.log(first.value) * value) * other.uncertainty
+                    if other.uncertainty is not None
+                    else None
+                ),
+            ),
+        )
+
+    exponent = other.value
+
+    # A single unit requires a single exact exponent.
+    if other.uncertainty is not None or np.any(exponent != exponent.flat[0]):
+        raise QuantityError(first.quantity(), other.quantity(), "**")
+
+    return monomial(first, exponent.flat[0].item(), value)
+
+
+def monomial(first: operand, exponent: Any, value: np.ndarray) -> quantityArray:
+    """
+    Wraps first ** exponent.
+    """
+
+    units = {u: power * exponent for u, power in first.signature.units}
+
+    uncertainty = None
+
+    if first.uncertainty is not None:
+        uncertainty = np.abs(exponent * first.value ** (exponent - 1)) * first.uncertainty
+
+    return result(value, parseUnit(ufd(units)), uncertainty)
+
+
+def rooted(ufunc: np.ufunc, inputs: list, kwargs: dict) -> quantityArray:
+    """
+    Square, square root, cube root and reciprocal.
+    """
+
+    (first,) = inputs
+    return monomial(first, EXPONENTS[ufunc], ufunc(first.value, **kwargs))
+
+
+def preserving(ufunc: np.ufunc, inputs: list, kwargs: dict) -> quantityArray:
+    """
+    Sign and rounding functions, the unit and the uncertainty are kept.
+    """
+
+    (first,) = inputs
+    return result(ufunc(first.value, **kwargs), first.signature, first.uncertainty)
+
+
+def transcendental(ufunc: np.ufunc, inputs: list, kwargs: dict) -> quantityArray:
+    """
+    Functions of dimensionless arguments, angles are converted to radians.
+    """
+
+    (first,) = inputs
+
+    if first.signature.units:
+        vector = REGISTRY.vector(first.signature)
+
+        if ufunc not in ANGULAR or vector != REGISTRY.vector(RADIANS):
+            raise QuantityError(first.quantity(), first.quantity(), ufunc.__name__)
+
+        first = first.scaled(conversion(first.quantity(), "rad")[0])
+
+    value = ufunc(first.value, **kwargs)
+    uncertainty = None
+
+    if first.uncertainty is not None:
+        uncertainty = np.abs(DERIVATIVES[ufunc](first.value)) * first.uncertainty
+
+    return result(value, EMPTY, uncertainty)
+
+
+def predicate(ufunc: np.ufunc, inputs: list, kwargs: dict) -> np.ndarray:
+    """
+    Elementwise tests, returning plain arrays.
+    """
+
+    (first,) = inputs
+    return ufunc(first.value, **kwargs)
+
+
+# Functions.
+
+
+def common(items: Any, symbol: str) -> list:
+    """
+    Converts items to the first unit-aware item's unit.
+    """
+
+    operands = [operand(item) for item in items]
+    reference = next(
+        (
+            item
+            for item in operands
+            if isinstance(item.source, (quantityArray, quantity))
+        ),
+        operands[0],
+    )
+
+    return [aligned(reference, item, symbol) for item in operands]
+
+
+def uncertainties(operands: list) -> Any:
+    """
+    Returns the operands' uncertainties, zeros where missing, None if all are.
+    """
+
+    if all(item.uncertainty is None for item in operands):
+        return None
+
+    return [
+        (
+            np.broadcast_to(item.uncertainty, item.value.shape)
+            if item.uncertainty is not None
+            else np.zeros(item.value.shape)
+        )
+        for item in operands
+    ]
+
+
+def arraySum(a: Any, axis: Any = None, **kwargs) -> Any:
+    """
+    Sum, uncertainties add in quadrature.
+    """
+
+    first = operand(a)
+
+    return result(
+        np.sum(first.value, axis=axis, **kwargs),
+        first.signature,
+        (
+            np.sqrt(np.sum(np.square(first.uncertainty), axis=axis, **kwargs))
+            if first.uncertainty is not None
+            else None
+        ),
+    )
+
+
+def arrayMean(a: Any, axis: Any = None, **kwargs) -> Any:
+    """
+    Mean, the uncertainty is propagated from the elements' ones.
+    """
+
+    first = operand(a)
+    value = np.mean(first.value, axis=axis, **kwargs)
+    uncertainty = None
+
+    if first.uncertainty is not None:
+        count = first.value.size / np.size(value)
+        uncertainty = (
+            np.sqrt(np.sum(np.square(first.uncertainty), axis=axis, **kwargs)) / count
+        )
+
+    return result(value, first.signature, uncertainty)
+
+
+def arrayStd(a: Any, axis: Any = None, **kwargs) -> Any:
+    """
+    Standard deviation of the values, in their unit.
+
+    The uncertainty is propagated to first order, the derivative with respect to each element
+    being its deviation from the mean over (N - ddof) times the standard deviation.
+    """
+
+    first = operand(a)
+    value = np.std(first.value, axis=axis, **kwargs)
+    uncertainty = None
+
+    if first.uncertainty is not None:
+        mean = np.mean(first.value, axis=axis, keepdims=True)
+        deviation = np.std(
+            first.value, axis=axis, ddof=kwargs.get("ddof", 0), keepdims=True
+        )
+        count = first.value.size / deviation.size - kwargs.get("ddof", 0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            derivatives = (first.value - mean) / (count * deviation)
+
+        uncertainty = np.sqrt(
+            np.sum(
+                np.square(derivatives * first.uncertainty),
+                axis=axis,
+                keepdims=kwargs.get("keepdims", False),
+            )
+        )
+
+    return result(value, first.signature, uncertainty)
+
+
+def arrayConcatenate(arrays: Any, axis: Any = 0, **kwargs) -> quantityArray:
+    """
+    Concatenation, arrays are converted to the first one's unit.
+    """
+
+    operands = common(arrays, "concatenate")
+    terms = uncertainties(operands)
+
+    return result(
+        np.concatenate([item.value for item in operands], axis=axis, **kwargs),
+        operands[0].signature,
+        np.concatenate(terms, axis=axis, **kwargs) if terms is not None else None,
+    )
+
+
+def arrayStack(arrays: Any, axis: Any = 0, **kwargs) -> quantityArray:
+    """
+    Stacking, arrays are converted to the first one's unit.
+    """
+
+    operands = common(arrays, "stack")
+    terms = uncertainties(operands)
+
+    return result(
+        np.stack([item.value for item in operands], axis=axis, **kwargs),
+        operands[0].signature,
+        np.stack(terms, axis=axis, **kwargs) if terms is not None else None,
+    )
+
+
+def arrayWhere(condition: Any, *choices) -> Any:
+    """
+    Elementwise selection between two arrays, converted to the first one's unit.
+    """
+
+    if len(choices) != 2:
+        return NotImplemented
+
+    condition = np.asarray(condition)
+    operands = common(choices, "where")
+    terms = uncertainties(operands)
+
+    return result(
+        np.where(condition, operands[0].value, operands[1].value),
+        operands[0].signature,
+        np.where(condition, terms[0], terms[1]) if terms is not None else None,
+    )
+
+
+def arraySort(a: Any, axis: Any = -1, **kwargs) -> quantityArray:
+    """
+    Sorting, uncertainties follow their values.
+    """
+
+    first = operand(a)
+    value, uncertainty = first.value, first.uncertainty
+
+    if axis is None:
+        value = value.reshape(-1)
+        uncertainty = uncertainty.reshape(-1) if uncertainty is not None else None
+        axis = -1
+
+    order = np.argsort(value, axis=axis, **kwargs)
+
+    return result(
+        np.take_along_axis(value, order, axis=axis),
+        first.signature,
+        (
+            np.take_along_axis(uncertainty, order, axis=axis)
+            if uncertainty is not None
+            else None
+        ),
+    )
+
+
+def arrayCumsum(a: Any, axis: Any = None, **kwargs) -> quantityArray:
+    """
+    Cumulative sum, uncertainties add in quadrature.
+    """
+
+    first = operand(a)
+
+    return result(
+        np.cumsum(first.value, axis=axis, **kwargs),
+        first.signature,
+        (
+            np.sqrt(np.cumsum(np.square(first.uncertainty), axis=axis, **kwargs))
+            if first.uncertainty is not None
+            else None
+        ),
+    )
+
+
+def arrayDiff(
+    a: Any, n: int = 1, axis: int = -1, prepend: Any = None, append: Any = None
+) -> quantityArray:
+    """
+    Discrete difference, prepend and append are converted to a's unit.
+
+    The n-th difference is a linear combination with binomial coefficients,
+    so its variance is the sum of the squared coefficients times the elements' variances.
+    """
+
+    operands = common(
+        [a] + [item for item in (prepend, a, append) if item is not None], "diff"
+    )
+    reference, operands = operands[0], operands[1:]
+
+    # Scalar edges are broadcast along axis, as numpy does.
+    shape = list(reference.value.shape)
+    shape[axis] = 1
+
+    for item in operands:
+        if item.value.ndim == 0:
+            item.value = np.broadcast_to(item.value, shape)
+
+    terms = uncertainties(operands)
+    values = [item.value for item in operands]
+
+    value = np.diff(np.concatenate(values, axis=axis), n=n, axis=axis)
+    uncertainty = None
+
+    if terms is not None:
+        variance = np.square(np.moveaxis(np.concatenate(terms, axis=axis), axis, -1))
+        length = variance.shape[-1] - n
+
+        # Binomial coefficients with alternating signs.
+        coefficients = np.ones(1)
+
+        for _ in range(n):
+            coefficients = np.convolve(coefficients, [1, -1])
+
+        uncertainty = np.moveaxis(
+            np.sqrt(
+                sum(
+                    coefficient**2 * variance[..., k : k + length]
+                    for k, coefficient in enumerate(coefficients)
+                )
+            ),
+            -1,
+            axis,
+        )
+
+    return result(value, reference.signature, uncertainty)
+
+
+# Empty signature.
+EMPTY = parseUnit("")
+
+# Radians, for angular arguments.
+RADIANS = parseUnit("rad")
+
+# Operators' symbols, for errors.
+SYMBOLS = {
+    np.add: "+",
+    np.subtract: "-",
+    np.less: "<",
+    np.less_equal: "<=",
+    np.greater: ">",
+    np.greater_equal: ">=",
+    np.equal: "==",
+    np.not_equal: "!=",
+}
+
+# Exponents of monomial functions.
+EXPONENTS = {np.square: 2, np.sqrt: 0.5, np.cbrt: 1 / 3, np.reciprocal: -1}
+
+# Functions accepting angles.
+ANGULAR = {np.sin, np.cos, np.tan}
+
+# Derivatives of transcendental functions.
+DERIVATIVES = {
+    np.sin: np.cos,
+    np.cos: lambda x: -np.sin(x),
+    np.tan: lambda x: 1 + np.tan(x) ** 2,
+    np.arcsin: lambda x: 1 / np.sqrt(1 - x**2),
+    np.arccos: lambda x: -1 / np.sqrt(1 - x**2),
+    np.arctan: lambda x: 1 / (1 + x**2),
+    np.sinh: np.cosh,
+    np.cosh: np.sinh,
+    np.tanh: lambda x: 1 - np.tanh(x) ** 2,
+    np.exp: np.exp,
+    np.expm1: np.exp,
+    np.exp2: lambda x: np.log(2) * np.exp2(x),
+    np.log: lambda x: 1 / x,
+    np.log2: lambda x: 1 / (x * np.log(2)),
+    np.log10: lambda x: 1 / (x * np.log(10)),
+    np.log1p: lambda x: 1 / (1 + x),
+}
+
+# Kernels by ufunc.
+UFUNCS = {
+    np.add: additive,
+    np.subtract: additive,
+    np.maximum: selective,
+    np.minimum: selective,
+    np.fmax: selective,
+    np.fmin: selective,
+    np.multiply: multiplicative,
+    np.divide: multiplicative,
+    np.power: powered,
+    np.negative: preserving,
+    np.positive: preserving,
+    np.absolute: preserving,
+    np.fabs: preserving,
+    np.rint: preserving,
+    np.floor: preserving,
+    np.ceil: preserving,
+    np.trunc: preserving,
+    np.isnan: predicate,
+    np.isinf: predicate,
+    np.isfinite: predicate,
+    np.signbit: predicate,
+}
+
+UFUNCS.update({ufunc: comparison for ufunc in SYMBOLS if ufunc not in UFUNCS})
+UFUNCS.update({ufunc: rooted for ufunc in EXPONENTS})
+UFUNCS.update({ufunc: transcendental for ufunc in DERIVATIVES})
+
+# Implementations by numpy function.
+FUNCTIONS = {
+    np.sum: arraySum,
+    np.mean: arrayMean,
+    np.std: arrayStd,
+    np.concatenate: arrayConcatenate,
+    np.stack: arrayStack,
+    np.where: arrayWhere,
+    np.sort: arraySort,
+    np.cumsum: arrayCumsum,
+    np.diff: arrayDiff,
+    np.shape: lambda a: np.shape(a.value),
+    np.ndim: lambda a: np.ndim(a.value),
+    np.size: lambda a, axis=None: np.size(a.value, axis),
+}
+
+# Quantities leave mixed operations to quantity arrays.
+ARRAYS.add(quantityArray)
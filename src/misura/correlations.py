@@ -0,0 +1,319 @@
+# Correlations.
+from __future__ import annotations
+
+from math import log, sqrt
+from typing import Any
+
+import numpy as np
+
+from .exceptions import MixingError
+from .quantities import conversion, convert, pack, quantity, unpack
+from .tables import REGISTRY
+
+"""
+Covariance-aware uncertainty propagation.
+
+Requires numpy.
+"""
+
+
+class source:
+    """
+    Independent input, identified by the object itself.
+    """
+
+    __slots__ = ("sigma",)
+
+    def __init__(self, sigma: Any) -> None:
+        self.sigma = sigma
+
+
+class correlated(quantity):
+    """
+    misura's correlated quantity class.
+
+    Opt-in linear propagation: every correlated quantity keeps the sparse Jacobian of its value
+    with respect to the independent inputs it depends on, so quantities reused in a formula
+    are accounted for. Uncertainties and covariances are only computed when requested,
+    as a single matrix product.
+
+    Values are expected to be scalars.
+    """
+
+    __slots__ = ("jacobian", "cached")
+
+    def __init__(self, value: Any, unit: str = "", uncertainty: Any = 0) -> None:
+        """
+        Correlated quantity initialization, an independent input.
+
+        - value: A number.
+        - unit: A properly formatted string including all the units with their exponents. e.g. "m s-1".
+        - uncertainty: Value's standard uncertainty.
+        """
+
+        super().__init__(value, unit, uncertainty)
+
+        # Checks currencies.
+        if REGISTRY.describeUnits(self.signature)[3]:
+            raise MixingError()
+
+    @classmethod
+    def fromResult(cls, result: quantity, terms: list) -> correlated:
+        """
+        Builds a correlated quantity from an exact result and its (derivative, operand) terms.
+        """
+
+        crl = object.__new__(cls)
+
+        crl.value = result.value
+        crl.signature = result.signature
+        crl.jacobian = dict()
+        crl.cached = None
+
+        # Chain rule.
+        for derivative, item in terms:
+            for key, partial in jacobianOf(item).items():
+                crl.jacobian[key] = crl.jacobian.get(key, 0) + derivative * partial
+
+        return crl
+
+    # UNCERTAINTY.
+
+    @property
+    def uncertainty(self) -> Any:
+        if self.cached is None:
+            self.cached = sqrt(covariance(self)[0, 0])
+
+        return self.cached
+
+    @uncertainty.setter
+    def uncertainty(self, uncertainty: Any) -> None:
+        # Setting an uncertainty makes the quantity an independent input.
+        self.jacobian = {source(uncertainty): 1.0} if uncertainty else dict()
+        self.cached = None
+
+    # MATH.
+
+    def __abs__(self) -> correlated:
+        return correlated.fromResult(
+            quantity.__abs__(exact(self)), [(1 if self.value >= 0 else -1, self)]
+        )
+
+    def __pos__(self) -> correlated:
+        return correlated.fromResult(quantity.__pos__(exact(self)), [(1, self)])
+
+    def __neg__(self) -> correlated:
+        return correlated.fromResult(quantity.__neg__(exact(self)), [(-1, self)])
+
+    # Addition.
+    def __add__(self, other: Any) -> correlated:
+        result = quantity.__add__(exact(self), exact(other))
+
+        return correlated.fromResult(
+            result, [(factor(self, result), self), (factor(other, result), other)]
+        )
+
+    def __radd__(self, other: Any) -> correlated:
+        return self.__add__(other)
+
+    # Subtraction.
+    def __sub__(self, other: Any) -> correlated:
+        result = quantity.__sub__(exact(self), exact(other))
+
+        return correlated.fromResult(
+            result, [(factor(self, result), self), (-factor(other, result), other)]
+        )
+
+    def __rsub__(self, other: Any) -> correlated:
+        if isinstance(other, quantity):
+            result = quantity.__sub__(exact(other), exact(self))
+
+        else:
+            result = quantity.__rsub__(exact(self), other)
+
+        return correlated.fromResult(
+            result, [(factor(other, result), other), (-factor(self, result), self)]
+        )
+
+    # Multiplication.
+    def __mul__(self, other: Any) -> correlated:
+        result = quantity.__mul__(exact(self), exact(other))
+
+        if not isinstance(other, quantity):
+            return correlated.fromResult(result, [(other, self)])
+
+        scale = scaling(self, other)
+
+        return correlated.fromResult(
+            result, [(scale * other.value, self), (scale * self.value, other)]
+        )
+
+    def __rmul__(self, other: Any) -> correlated:
+        return self.__mul__(other)
+
+    # Division.
+    def __truediv__(self, other: Any) -> correlated:
+        result = quantity.__truediv__(exact(self), exact(other))
+
+        if not isinstance(other, quantity):
+            return correlated.fromResult(result, [(1 / other, self)])
+
+        scale = scaling(self, other)
+
+        return correlated.fromResult(
+            result,
+            [
+                (1 / (scale * other.value), self),
+                (-self.value / (scale * other.value**2), other),
+            ],
+        )
+
+    def __rtruediv__(self, other: Any) -> correlated:
+        if not isinstance(other, quantity):
+            result = quantity.__rtruediv__(exact(self), other)
+            return correlated.fromResult(result, [(-other / self.value**2, self)])
+
+        result = quantity.__truediv__(exact(other), exact(self))
+        scale = scaling(other, self)
+
+        return correlated.fromResult(
+            result,
+            [
+                (1 / (scale * self.value), other),
+                (-other.value / (scale * self.value**2), self),
+            ],
+        )
+
+    # Power.
+    def __pow__(self, other: Any) -> correlated:
+        result = quantity.__pow__(exact(self), other)
+
+        if other == 0:
+            return correlated.fromResult(result, [])
+
+        return correlated.fromResult(
+            result, [(other * self.value ** (other - 1), self)]
+        )
+
+    def __rpow__(self, other: Any) -> correlated:
+        result = quantity.__rpow__(exact(self), other)
+        return correlated.fromResult(result, [(log(other) * result.value, self)])
+
+    # SHORTCUTS.
+
+    def cto(
+        self, targets: str, partial: bool = False, un_pack: bool = True
+    ) -> correlated:  # Convert to.
+        return self.linear(lambda qnt: convert(qnt, targets, partial, un_pack))
+
+    def uto(self, targets: str = "") -> correlated:  # Unpack to.
+        return self.linear(lambda qnt: unpack(qnt, targets))
+
+    def pto(
+        self, targets: str, ignore: str = "", full: bool = False
+    ) -> correlated:  # Pack to.
+        return self.linear(lambda qnt: pack(qnt, targets, ignore, full))
+
+    def linear(self, operation: Any) -> correlated:
+        """
+        Applies a change of units, whose derivative is its factor.
+        """
+
+        unit = quantity.fromSignature(1.0, self.signature, 0.0)
+        return correlated.fromResult(
+            operation(exact(self)), [(operation(unit).value, self)]
+        )
+
+
+# Covariances.
+
+
+def covariance(*quantities) -> np.ndarray:
+    """
+    Returns the covariance matrix of the passed quantities.
+
+    Correlated quantities contribute their Jacobians, other quantities are independent.
+    """
+
+    jacobians = [jacobianOf(item) for item in quantities]
+
+    # Independent inputs, in order of appearance.
+    columns = dict()
+
+    for jacobian in jacobians:
+        for key in jacobian:
+            columns.setdefault(key, len(columns))
+
+    matrix = np.zeros((len(jacobians), len(columns)))
+
+    for row, jacobian in enumerate(jacobians):
+        for key, derivative in jacobian.items():
+            matrix[row, columns[key]] = derivative
+
+    variances = np.array([float(key.sigma) ** 2 for key in columns])
+
+    return (matrix * variances) @ matrix.T
+
+
+def correlation(*quantities) -> np.ndarray:
+    """
+    Returns the correlation matrix of the passed quantities.
+    """
+
+    matrix = covariance(*quantities)
+    sigmas = np.sqrt(np.diag(matrix))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return matrix / np.outer(sigmas, sigmas)
+
+
+# Utilities.
+
+
+def jacobianOf(item: Any) -> dict:
+    """
+    Returns the Jacobian of an operand.
+
+    Uncertain quantities that are not correlated ones are new independent inputs.
+    """
+
+    if isinstance(item, correlated):
+        return item.jacobian
+
+    if isinstance(item, quantity) and item.uncertainty:
+        return {source(item.uncertainty): 1.0}
+
+    return dict()
+
+
+def exact(item: Any) -> Any:
+    """
+    Returns an operand stripped of its uncertainty.
+    """
+
+    if isinstance(item, quantity):
+        return quantity.fromSignature(item.value, item.signature, 0 * item.value)
+
+    return item
+
+
+def factor(item: Any, result: quantity) -> Any:
+    """
+    Returns the factor converting an operand to the result's unit.
+    """
+
+    if not isinstance(item, quantity) or item.signature == result.signature:
+        return 1
+
+    return conversion(item, result.unit())[0]
+
+
+def scaling(first: quantity, second: quantity) -> Any:
+    """
+    Returns the factor applied to second when multiplied by or divided from first.
+    """
+
+    if first.convertible and second.convertible:
+        return conversion(second, first.unit(), partial=True)[0]
+
+    return 1
@@ -1,20 +1,78 @@
 # Currencies.
 from __future__ import annotations
 
+from asyncio import get_running_loop, sleep
+from threading import Thread
+from time import time
 from typing import Any
 
 from misura.quantities import quantity
 
 from .exceptions import InitError, OperationError
+from .globals import currencies
 from .quantities import compare, quantity
-from .tables import fetchCurrencies, getCurrencies
+from .tables import REGISTRY, fetchCurrencies, loadCurrencies
+from .utilities import signature
 
-# Checks currency rates on currencies import.
-fetchCurrencies()
+# Currency rates are loaded on first use, importing does no I/O.
+currencies.enabled = True
+
+
+def preload(background: bool = False) -> None:
+    """
+    Loads currency rates ahead of their first use.
+
+    'background = True' loads them in a separate thread.
+    """
+
+    if background:
+        Thread(target=fetchCurrencies, daemon=True).start()
+
+    else:
+        fetchCurrencies()
+
+
+async def refresh() -> None:
+    """
+    Refreshes currency rates without blocking the event loop.
+    """
+
+    await get_running_loop().run_in_executor(None, fetchCurrencies)
+
+
+async def refresher(retry: float = 60.0) -> None:
+    """
+    Keeps currency rates up to date in the background.
+
+    Meant to be run as a task, e.g. asyncio.create_task(refresher()).
+    While it runs, conversions use the last good rates and never wait on I/O.
+    Failed refreshes keep the last good rates and are retried after 'retry' seconds.
+    """
+
+    currencies.background = True
+
+    try:
+        while True:
+            try:
+                await refresh()
+                delay = max(currencies.expiry - time(), 1.0)
+
+            except Exception:
+                delay = retry
+
+            await sleep(delay)
+
+    finally:
+        currencies.background = False
 
 
 class currency(quantity):
+    __slots__ = ()
+
     def __init__(self, value: Any, symbol: str = "") -> None:
+        # Symbols are checked against the rates.
+        loadCurrencies()
+
         super().__init__(value, symbol)
 
         try:
@@ -25,14 +83,37 @@ class currency(quantity):
         except AssertionError:
             raise InitError(value, symbol)
 
-        table: dict = getCurrencies()
-        if not any([any([u in table[family] for u in self.units]) for family in table]):
+        if not REGISTRY.currency(symbol):
             raise InitError(value, symbol)
 
-        else:
-            # Valid currencies are always convertible.
-            self.convertible = True
-            self.dimensions = {"currency": 1}
+    @classmethod
+    def fromSignature(
+        cls, value: Any, sig: signature, uncertainty: Any = 0
+    ) -> currency:
+        """
+        Builds a currency from already validated parts, skipping every check.
+
+        Currencies carry no uncertainty.
+        """
+
+        crn = object.__new__(cls)
+
+        crn.value = value
+        crn.uncertainty = 0 * value
+        crn.signature = sig
+
+        return crn
+
+    # UNITS.
+
+    @property
+    def convertible(self) -> bool:
+        # Valid currencies are always convertible.
+        return True
+
+    @property
+    def dimensions(self) -> dict:
+        return {"currency": 1}
 
     # STRINGS.
     # Removed uncertainty.
@@ -59,37 +140,37 @@ class currency(quantity):
 
     # Abs.
     def __abs__(self) -> currency:
-        return currency(abs(self.value), self.unit())
+        return currency.fromSignature(abs(self.value), self.signature)
 
     # Positive.
     def __pos__(self) -> currency:
-        return currency(+self.value, self.unit())
+        return currency.fromSignature(+self.value, self.signature)
 
     # Negative.
     def __neg__(self) -> currency:
-        return currency(-self.value, self.unit())
+        return currency.fromSignature(-self.value, self.signature)
 
     # Round.
     def __round__(self, number: int) -> currency:
-        return currency(round(self.value, number), self.unit())
+        return currency.fromSignature(round(self.value, number), self.signature)
 
     # Floor.
     def __floor__(self) -> currency:
         from math import floor
 
-        return currency(floor(self.value), self.unit())
+        return currency.fromSignature(floor(self.value), self.signature)
 
     # Ceil.
     def __ceil__(self) -> currency:
         from math import ceil
 
-        return currency(ceil(self.value), self.unit())
+        return currency.fromSignature(ceil(self.value), self.signature)
 
     # Trunc.
     def __trunc__(self) -> currency:
         from math import trunc
 
-        return currency(trunc(self.value), self.unit())
+        return currency.fromSignature(trunc(self.value), self.signature)
 
     # Addition.
     def __add__(self, other: currency) -> currency:
@@ -99,7 +180,7 @@ class currency(quantity):
         if not compare(self, other):
             other = other.cto(self.unit())
 
-        return currency(self.value + other.value, self.unit())
+        return currency.fromSignature(self.value + other.value, self.signature)
 
     # Subtraction.
     def __sub__(self, other: currency) -> currency:
@@ -109,12 +190,12 @@ class currency(quantity):
         if not compare(self, other):
             other = other.cto(self.unit())
 
-        return currency(self.value + other.value, self.unit())
+        return currency.fromSignature(self.value + other.value, self.signature)
 
     # Multiplication.
     def __mul__(self, other: Any) -> currency:
         if not isinstance(other, currency):
-            return currency(self.value * other, self.unit())
+            return currency.fromSignature(self.value * other, self.signature)
 
         raise OperationError(self, other, "*")
 
@@ -124,7 +205,7 @@ class currency(quantity):
     # Division.
     def __truediv__(self, other: Any) -> any:
         if not isinstance(other, currency):
-            return currency(self.value / other, self.unit())
+            return currency.fromSignature(self.value / other, self.signature)
 
         raise OperationError(self, other, "/")
 
@@ -133,7 +214,7 @@ class currency(quantity):
 
     def __floordiv__(self, other: Any) -> any:
         if not isinstance(other, currency):
-            return currency(self.value // other, self.unit())
+            return currency.fromSignature(self.value // other, self.signature)
 
         raise OperationError(self, other, "//")
 
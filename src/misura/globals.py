@@ -18,12 +18,29 @@ class logic:
     ignoreUncertainty = False
 
 
+class sampling:
+    """
+    Monte Carlo global options.
+    """
+
+    count = 10000  # Draws per sampled quantity.
+
+
 class currencies:
     """
     Currency global options.
     """
 
     path = ""  # File path for local rates.
+    enabled = False  # Set on importing misura.currencies.
+
+    provider = None  # Rates provider, defaults to misura's rates over HTTP.
+    history = None  # Optional misura.history.rateHistory recording every download.
+
+    lifetime = 3600 * 6  # Rates are reloaded after 6 hours.
+    expiry = 0.0  # Expiry time of the rates in memory.
+    source = None  # Provider of the rates in memory.
+    background = False  # Set while a background refresher runs.
 
 
 class defined:
@@ -34,3 +51,6 @@ class defined:
     BASE_TABLE = {}
     DERIVED_TABLE = {}
     DERIVED_UNPACKING_TABLE = {}
+
+    # Bumped on every definition, invalidates caches over the tables.
+    generation = 0
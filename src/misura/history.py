@@ -0,0 +1,332 @@
+# History.
+from __future__ import annotations
+
+import json
+from os import fdopen, makedirs, remove, replace, stat, truncate
+from os.path import join
+from tempfile import mkstemp
+from typing import Any
+
+import numpy as np
+
+from .exceptions import ConversionError
+from .ledgers import ledger
+from .tables import lockFile
+
+"""
+Historical currency rates.
+
+Requires numpy.
+"""
+
+
+class rateHistory:
+    """
+    misura's historical rates store.
+
+    Rates are stored by column in a directory:
+
+    - codes.json: Currencies, in column order, and the version of the binary files.
+    - times.<version>.bin: Snapshots' timestamps, as sorted float64.
+    - rates.<version>.bin: Snapshots' rates, as float64 rows, NaN where a currency is missing.
+
+    Both binary files are memory-mapped, as-of lookups are binary searches over the timestamps
+    and new snapshots are appended as a single row. Writes and mappings hold the store's lock,
+    so that a rewrite is never mapped halfway.
+
+    Rewrites create a new version of the binary files and commit it by replacing codes.json,
+    so that an interrupted rewrite leaves the previous version in place. Rows left partial by
+    an interrupted append are ignored and dropped on the next append.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        - path: Directory of the store, created if missing.
+        """
+
+        makedirs(path, exist_ok=True)
+
+        self.path: str = path
+
+        # Memory maps and the files' state they refer to.
+        self.state: tuple = ()
+        self.version: int = 0
+        self.codes: tuple = ()
+        self.columns: dict = dict()
+        self.times: np.ndarray = np.empty(0)
+        self.rates: np.ndarray = np.empty((0, 0))
+
+    # STRINGS.
+
+    def __str__(self) -> str:
+        self.load()
+        return "rateHistory({} snapshots, {} currencies)".format(
+            len(self.times), len(self.codes)
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self.times)
+
+    # FILES.
+
+    def file(self, name: str, version: int = None) -> str:
+        """
+        Returns the path of a file of the store, binary files being versioned.
+        """
+
+        if version is not None:
+            name = "{}.{}.bin".format(name, version)
+
+        return join(self.path, name)
+
+    def stat(self, version: int = None) -> tuple:
+        """
+        Returns the state of the store's files, None for missing ones.
+        """
+
+        version = self.version if version is None else version
+        state = []
+
+        for path in (
+            self.file("codes.json"),
+            self.file("times", version),
+            self.file("rates", version),
+        ):
+            try:
+                info = stat(path)
+                state.append((info.st_ino, info.st_size, info.st_mtime_ns))
+
+            except OSError:  # Empty or rewritten store.
+                state.append(None)
+
+        return tuple(state)
+
+    def load(self) -> None:
+        """
+        Maps the store's files, again only if they changed.
+        """
+
+        if self.stat() == self.state:
+            return
+
+        # Files are mapped while no rewrite is in progress.
+        with lockFile(self.file("history.lock")):
+            self.map()
+
+    def map(self) -> None:
+        """
+        Maps the store's files, the lock being held.
+        """
+
+        try:
+            with open(self.file("codes.json"), "r") as file:
+                manifest = json.load(file)
+
+        except FileNotFoundError:  # Empty store.
+            manifest = {"version": 0, "codes": []}
+
+        state = self.stat(manifest["version"])
+
+        if state == self.state:
+            return
+
+        self.state = state
+        self.version = manifest["version"]
+
+        # Empty store.
+        if None in state:
+            self.codes, self.columns = (), dict()
+            self.times, self.rates = np.empty(0), np.empty((0, 0))
+            return
+
+        self.codes = tuple(manifest["codes"])
+
+        self.columns = {code: index for index, code in enumerate(self.codes)}
+
+        count = state[1][1] // 8
+        width = len(self.codes)
+
+        # Rows may be appended while mapping, only whole ones are mapped.
+        if width:
+            count = min(count, state[2][1] // (8 * width))
+
+        if not count:
+            self.times, self.rates = np.empty(0), np.empty((0, width))
+            return
+
+        self.times = np.memmap(
+            self.file("times", self.version), dtype=np.float64, mode="r", shape=(count,)
+        )
+
+        # Snapshots without rates.
+        if not width:
+            self.rates = np.empty((count, 0))
+            return
+
+        self.rates = np.memmap(
+            self.file("rates", self.version),
+            dtype=np.float64,
+            mode="r",
+            shape=(count, width),
+        )
+
+    def write(self, codes: list, times: np.ndarray, rates: np.ndarray) -> None:
+        """
+        Rewrites the whole store as a new version, the lock being held.
+        """
+
+        version = self.version + 1
+
+        # Overwrites the leftovers of an interrupted rewrite, if any.
+        with open(self.file("times", version), "wb") as file:
+            file.write(times.astype(np.float64).tobytes())
+
+        with open(self.file("rates", version), "wb") as file:
+            file.write(rates.astype(np.float64).tobytes())
+
+        # Commits the new version.
+        descriptor, temporary = mkstemp(dir=self.path)
+
+        with fdopen(descriptor, "w") as file:
+            json.dump({"version": version, "codes": codes}, file)
+
+        replace(temporary, self.file("codes.json"))
+
+        # Drops the previous version.
+        for name in ("times", "rates"):
+            try:
+                remove(self.file(name, self.version))
+
+            except OSError:  # Missing or still in use.
+                pass
+
+    # INGESTION.
+
+    def ingest(self, rates: dict, when: float) -> None:
+        """
+        Adds a snapshot of rates taken at when, a Unix timestamp.
+
+        Snapshots are appended, the store is only rewritten on new currencies or late snapshots.
+        Ingesting a snapshot twice has no effect.
+        """
+
+        with lockFile(self.file("history.lock")):
+            self.map()
+
+            times = np.array(self.times)
+            index = np.searchsorted(times, when)
+
+            # Already ingested.
+            if index < len(times) and times[index] == when:
+                return
+
+            codes = list(self.codes)
+            codes += sorted(code for code in rates if code not in self.columns)
+
+            row = np.full(len(codes), np.nan)
+            row[[codes.index(code) for code in rates]] = list(rates.values())
+
+            # Appends.
+            if self.codes and len(codes) == len(self.codes) and index == len(times):
+                # Drops the partial rows of an interrupted append.
+                if self.state[1][1] != 8 * len(times):
+                    truncate(self.file("times", self.version), 8 * len(times))
+
+                if self.state[2][1] != 8 * self.rates.size:
+                    truncate(self.file("rates", self.version), 8 * self.rates.size)
+
+                with open(self.file("times", self.version), "ab") as file:
+                    file.write(np.float64(when).tobytes())
+
+                with open(self.file("rates", self.version), "ab") as file:
+                    file.write(row.tobytes())
+
+            # Rewrites.
+            else:
+                table = np.full((len(times), len(codes)), np.nan)
+                table[:, : len(self.codes)] = self.rates
+
+                self.write(
+                    codes,
+                    np.insert(times, index, when),
+                    np.insert(table, index, row, axis=0),
+                )
+
+            self.map()
+
+    # LOOKUP.
+
+    def rows(self, dates: Any) -> np.ndarray:
+        """
+        Returns the indices of the latest snapshots as of dates, -1 where none is.
+        """
+
+        self.load()
+        return np.searchsorted(self.times, timestamps(dates), side="right") - 1
+
+    def asof(self, date: Any) -> dict:
+        """
+        Returns the rates as of date.
+        """
+
+        row = int(self.rows([date])[0])
+
+        if row < 0:
+            return dict()
+
+        return {
+            code: float(rate)
+            for code, rate in zip(self.codes, self.rates[row])
+            if not np.isnan(rate)
+        }
+
+    # CONVERSION.
+
+    def convert(self, led: ledger, dates: Any, target: str) -> np.ndarray:
+        """
+        Returns the ledger's amounts converted to target with the rates as of dates, one per amount.
+        """
+
+        rows = self.rows(dates)
+
+        if rows.shape != led.amounts.shape or (len(rows) and rows.min() < 0):
+            raise ConversionError(led, target)
+
+        if target not in self.columns or any(
+            symbol not in self.columns for symbol in led.symbols
+        ):
+            raise ConversionError(led, target)
+
+        columns = np.array([self.columns[symbol] for symbol in led.symbols], dtype=int)
+
+        # Gathers one source and one target rate per amount.
+        sources = self.rates[rows, columns[led.indices]]
+        targets = self.rates[rows, self.columns[target]]
+
+        if np.isnan(sources).any() or np.isnan(targets).any():
+            raise ConversionError(led, target)
+
+        return led.amounts * targets / sources
+
+    def cto(self, led: ledger, dates: Any, target: str) -> ledger:  # Convert to.
+        return ledger(self.convert(led, dates, target), target)
+
+
+# Dates.
+def timestamps(dates: Any) -> np.ndarray:
+    """
+    Returns dates as Unix timestamps.
+
+    Dates can be numbers, ISO 8601 strings, numpy datetime64 values or datetime objects.
+    """
+
+    dates = np.asarray(dates)
+
+    if dates.dtype.kind in "OMU":
+        dates = dates.astype("datetime64[us]").astype(np.int64) / 1e6
+
+    return dates.astype(np.float64)
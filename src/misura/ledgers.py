@@ -0,0 +1,330 @@
+# Ledgers.
+from __future__ import annotations
+
+from decimal import Decimal, localcontext
+from typing import Any
+
+import numpy as np
+
+from .currencies import currency
+from .exceptions import ConversionError, InitError
+from .globals import currencies
+from .tables import REGISTRY, fetchCurrencies, getMinorUnits, loadCurrencies
+from .utilities import cache
+
+"""
+Array-backed multi-currency amounts.
+
+Requires numpy.
+"""
+
+
+class ledger:
+    """
+    misura's ledger class.
+
+    Stores an amount column and a currency column. Currencies are kept as indices
+    into the ledger's symbols, so converting the whole ledger only takes
+    one rate per distinct currency.
+    """
+
+    def __init__(self, amounts: Any, symbols: Any) -> None:
+        """
+        Ledger initialization.
+
+        - amounts: Array-like of amounts.
+        - symbols: Array-like of currency codes, one per amount, or a single code for every amount.
+        """
+
+        # Symbols are checked against the rates.
+        loadCurrencies()
+
+        amounts = np.asarray(amounts)
+
+        if isinstance(symbols, str):
+            symbols = np.full(amounts.shape, symbols)
+
+        symbols = np.asarray(symbols, dtype=str)
+
+        if amounts.ndim != 1 or amounts.shape != symbols.shape:
+            raise InitError(amounts, str(symbols))
+
+        # Distinct currencies and, for every amount, the index of its currency.
+        unique, indices = np.unique(symbols, return_inverse=True)
+
+        for symbol in unique:
+            if not REGISTRY.currency(symbol):
+                raise InitError(amounts, symbol)
+
+        self.amounts: np.ndarray = amounts
+        self.symbols: tuple = tuple(unique.tolist())
+        self.indices: np.ndarray = indices.reshape(-1)
+
+    @classmethod
+    def fromCurrencies(cls, items: Any) -> ledger:
+        """
+        Builds a ledger from an iterable of currency objects.
+        """
+
+        items = list(items)
+        return cls([crn.value for crn in items], [crn.unit() for crn in items])
+
+    # PRINTERS.
+
+    def unit(self) -> str:
+        """
+        Returns the ledger's currencies.
+        """
+
+        return " ".join(self.symbols)
+
+    def codes(self) -> np.ndarray:
+        """
+        Returns the currency column.
+        """
+
+        return np.asarray(self.symbols, dtype=str)[self.indices]
+
+    # STRINGS.
+
+    def __str__(self) -> str:
+        return "ledger({} entries, {})".format(len(self), self.unit())
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    # CONTAINER.
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, (int, np.integer)):
+            return currency(self.amounts[index], self.symbols[self.indices[index]])
+
+        return type(self)(self.amounts[index], self.codes()[index])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    # CONVERSION.
+
+    def rates(self, target: str) -> np.ndarray:
+        """
+        Returns the rate vector, indexed as the ledger's symbols, converting them to target.
+        """
+
+        # A background refresher keeps the rates up to date.
+        if not currencies.background:
+            fetchCurrencies()
+
+        # Refreshes swap the whole table, so this is a consistent snapshot.
+        table: dict = REGISTRY.currencies
+
+        if target not in table:
+            raise ConversionError(self, target)
+
+        return np.array([table[symbol] for symbol in self.symbols]) / table[target]
+
+    def convert(self, target: str) -> np.ndarray:
+        """
+        Returns the amounts converted to target.
+        """
+
+        return self.amounts * self.rates(target)[self.indices]
+
+    def cto(self, target: str) -> ledger:  # Convert to.
+        return type(self)(self.convert(target), target)
+
+    def total(self, target: str) -> currency:
+        """
+        Returns the sum of the ledger in target.
+        """
+
+        return currency(self.convert(target).sum(), target)
+
+
+class minorLedger(ledger):
+    """
+    misura's ledger for exact money.
+
+    Amounts are stored as int64 minor units, e.g. cents, according to each currency's
+    ISO 4217 exponent. Rates are applied in fixed point with RATE_DIGITS significant digits,
+    computed once per currency pair through Decimal, and rounded half to even.
+    """
+
+    def __init__(self, amounts: Any, symbols: Any) -> None:
+        """
+        Minor ledger initialization.
+
+        - amounts: Array-like of integer amounts in minor units.
+        - symbols: Array-like of currency codes, one per amount, or a single code for every amount.
+        """
+
+        amounts = np.asarray(amounts)
+
+        if amounts.size and not np.issubdtype(amounts.dtype, np.integer):
+            raise InitError(amounts, str(symbols))
+
+        super().__init__(amounts.astype(np.int64), symbols)
+
+    @classmethod
+    def fromMajor(cls, amounts: Any, symbols: Any) -> minorLedger:
+        """
+        Builds a minor ledger from amounts in major units, e.g. 12.34 EUR.
+        """
+
+        major = ledger(amounts, symbols)
+        exponents = np.array([getMinorUnits(symbol) for symbol in major.symbols])
+
+        minor = np.rint(major.amounts * 10.0 ** exponents[major.indices])
+        return cls(minor.astype(np.int64), major.codes())
+
+    @classmethod
+    def fromCurrencies(cls, items: Any) -> minorLedger:
+        """
+        Builds a minor ledger from an iterable of currency objects.
+        """
+
+        items = list(items)
+        return cls.fromMajor(
+            [crn.value for crn in items], [crn.unit() for crn in items]
+        )
+
+    def major(self) -> np.ndarray:
+        """
+        Returns the amounts in major units.
+        """
+
+        exponents = np.array([getMinorUnits(symbol) for symbol in self.symbols])
+        return self.amounts / 10.0 ** exponents[self.indices]
+
+    # CONTAINER.
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, (int, np.integer)):
+            symbol = self.symbols[self.indices[index]]
+
+            return currency(
+                Decimal(int(self.amounts[index])).scaleb(-getMinorUnits(symbol)),
+                symbol,
+            )
+
+        return super().__getitem__(index)
+
+    # CONVERSION.
+
+    def rates(self, target: str) -> np.ndarray:
+        """
+        Returns the fixed-point rates, indexed as the ledger's symbols, converting them to target.
+
+        Rates are (mantissa, exponent) integer rows, each standing for mantissa / 10 ** exponent.
+        """
+
+        # A background refresher keeps the rates up to date.
+        if not currencies.background:
+            fetchCurrencies()
+
+        # Refreshes swap the whole table, so this is a consistent snapshot.
+        table: dict = REGISTRY.currencies
+
+        if target not in table:
+            raise ConversionError(self, target)
+
+        return np.array(
+            [pairRate(table, symbol, target) for symbol in self.symbols],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+
+    def convert(self, target: str) -> np.ndarray:
+        """
+        Returns the amounts converted to target, in target's minor units.
+        """
+
+        result = np.empty_like(self.amounts)
+
+        # One vectorized product per currency.
+        for index, (mantissa, exponent) in enumerate(self.rates(target)):
+            selected = self.indices == index
+            result[selected] = fixedProduct(
+                self.amounts[selected], int(mantissa), int(exponent)
+            )
+
+        return result
+
+    def total(self, target: str) -> currency:
+        """
+        Returns the sum of the ledger in target.
+        """
+
+        return currency(
+            Decimal(int(self.convert(target).sum())).scaleb(-getMinorUnits(target)),
+            target,
+        )
+
+
+# Fixed-point rates.
+def pairRate(table: dict, source: str, target: str) -> tuple:
+    """
+    Returns the fixed-point rate converting source's minor units to target's ones,
+    as a (mantissa, exponent) pair with RATE_DIGITS significant digits.
+    """
+
+    # Rates change on every load, as does their expiry.
+    key = (source, target, currencies.expiry)
+    rate = PAIRS.get(key)
+
+    if rate is None:
+        with localcontext() as context:
+            context.prec = 34
+
+            value = Decimal(repr(table[source])) / Decimal(repr(table[target]))
+            value = value.scaleb(getMinorUnits(target) - getMinorUnits(source))
+
+            # Exponents are bounded so that products fit in int64.
+            exponent = RATE_DIGITS - 1 - value.adjusted() if value else 0
+            exponent = min(max(exponent, 0), MAX_EXPONENT)
+
+            rate = (int(value.scaleb(exponent).to_integral_value()), exponent)
+
+        PAIRS.set(key, rate)
+
+    return rate
+
+
+def fixedProduct(amounts: np.ndarray, mantissa: int, exponent: int) -> np.ndarray:
+    """
+    Returns amounts * mantissa / 10 ** exponent, exactly in int64 and rounded half to even.
+    """
+
+    base = 10**RATE_DIGITS
+
+    # amounts * mantissa = upper * base + lower.
+    high, low = np.divmod(amounts, base)
+    upper, lower = high * mantissa, low * mantissa
+
+    if exponent <= RATE_DIGITS:
+        quotient, remainder = np.divmod(lower, 10**exponent)
+        result = upper * 10 ** (RATE_DIGITS - exponent) + quotient
+
+    else:
+        quotient, rest = np.divmod(upper, 10 ** (exponent - RATE_DIGITS))
+        carry, remainder = np.divmod(rest * base + lower, 10**exponent)
+        result = quotient + carry
+
+    # Rounds half to even.
+    half = 2 * remainder - 10**exponent
+    up = (half > 0) | ((half == 0) & (result % 2 == 1))
+
+    return result + up
+
+
+# Fixed-point rates' significant digits.
+RATE_DIGITS = 9
+
+# Fixed-point rates' largest exponent, smaller rates keep fewer significant digits.
+MAX_EXPONENT = 2 * RATE_DIGITS
+
+# Fixed-point rates' cache.
+PAIRS = cache(1024)
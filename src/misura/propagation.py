@@ -0,0 +1,177 @@
+# Propagation.
+from decimal import Decimal
+from math import log, sqrt
+from typing import Any
+
+from .utilities import checkIter
+
+"""
+Uncertainty propagation kernels.
+
+Kernels are picked by the kind of the values involved: math for Python numbers,
+single vectorized passes for numpy arrays and exact arithmetic for Decimal values.
+"""
+
+
+class kernel:
+    """
+    Scalar kernel, for Python numbers.
+    """
+
+    rank = 0  # Precedence among kernels.
+
+    def any(self, obj: Any) -> bool:
+        """
+        Checks whether any element is non-zero.
+        """
+
+        return bool(obj)
+
+    def valid(self, uncertainty: Any) -> bool:
+        """
+        Checks whether an uncertainty is non-negative.
+        """
+
+        return uncertainty >= 0
+
+    def quadrature(self, *terms) -> Any:
+        """
+        Returns the square root of the sum of the squared terms.
+        """
+
+        return sqrt(sum([term**2 for term in terms]))
+
+    def log(self, obj: Any) -> Any:
+        return log(obj)
+
+    def scale(self, obj: Any, factor: float) -> Any:
+        """
+        Returns obj times a conversion factor.
+        """
+
+        return obj * factor
+
+
+class sequenceKernel(kernel):
+    """
+    Kernel for other iterables, element by element.
+    """
+
+    rank = 1
+
+    def any(self, obj: Any) -> bool:
+        return any(obj)
+
+    def valid(self, uncertainty: Any) -> bool:
+        return all(uncertainty >= 0)
+
+
+class numpyKernel(kernel):
+    """
+    Kernel for numpy arrays and scalars, one vectorized pass per call.
+    """
+
+    rank = 3
+
+    def __init__(self) -> None:
+        import numpy
+
+        self.np = numpy
+
+    def any(self, obj: Any) -> bool:
+        return bool(self.np.any(obj))
+
+    def valid(self, uncertainty: Any) -> bool:
+        return bool(self.np.all(self.np.asarray(uncertainty) >= 0))
+
+    def quadrature(self, *terms) -> Any:
+        if len(terms) == 2:
+            # Avoids overflowing intermediate squares.
+            return self.np.hypot(*terms)
+
+        return self.np.sqrt(sum([self.np.square(term) for term in terms]))
+
+    def log(self, obj: Any) -> Any:
+        return self.np.log(obj)
+
+
+class decimalKernel(kernel):
+    """
+    Kernel for Decimal values, keeping results Decimal.
+    """
+
+    rank = 2
+
+    def quadrature(self, *terms) -> Any:
+        return Decimal(sum([term**2 for term in terms])).sqrt()
+
+    def log(self, obj: Any) -> Any:
+        return Decimal(obj).ln()
+
+    def scale(self, obj: Any, factor: float) -> Any:
+        # Factors are converted from their shortest representation, e.g. 0.001.
+        return obj * Decimal(repr(factor)) if factor != 1 else obj
+
+
+def kernelOf(*objs) -> kernel:
+    """
+    Returns the kernel for the passed values.
+
+    numpy values take precedence over Decimal ones, which take precedence over plain numbers.
+    """
+
+    chosen = SCALAR
+
+    for obj in objs:
+        found = KERNELS.get(type(obj))
+
+        if found is None:
+            found = kernelFor(type(obj), obj)
+            KERNELS[type(obj)] = found
+
+        if found.rank > chosen.rank:
+            chosen = found
+
+    return chosen
+
+
+def kernelFor(kind: type, obj: Any) -> kernel:
+    """
+    Picks the kernel for a type of values.
+    """
+
+    global NUMPY
+
+    if kind.__module__ == "numpy":
+        # numpy is only imported once numpy values show up.
+        if NUMPY is None:
+            NUMPY = numpyKernel()
+
+        return NUMPY
+
+    if issubclass(kind, Decimal):
+        return DECIMAL
+
+    if checkIter(obj):
+        return SEQUENCE
+
+    return SCALAR
+
+
+def uncertain(obj: Any) -> bool:
+    """
+    Checks whether an uncertainty has any non-zero element.
+    """
+
+    return kernelOf(obj).any(obj)
+
+
+# Kernels.
+SCALAR = kernel()
+SEQUENCE = sequenceKernel()
+DECIMAL = decimalKernel()
+NUMPY = None
+
+# Kernels by type of value.
+KERNELS = {int: SCALAR, float: SCALAR, complex: SCALAR, bool: SCALAR, Decimal: DECIMAL}
+
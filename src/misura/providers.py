@@ -0,0 +1,111 @@
+# Providers.
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+import requests
+
+"""
+Currency rates providers.
+
+Rates are returned as a dictionary of currencies and their rates
+with respect to a common reference, e.g. {"EUR": 0.92, "USD": 1.0}.
+"""
+
+RATES_URL = "https://misura.diantonioandrea.com/currencies/rates.json"
+
+
+class provider(ABC):
+    """
+    Base class for currency rates providers.
+    """
+
+    @abstractmethod
+    def fetch(self) -> dict:
+        """
+        Returns the current rates.
+        """
+
+
+class httpProvider(provider):
+    """
+    Fetches rates over HTTP.
+
+    Connections are pooled through a single session and requests are conditional,
+    so unchanged rates are not downloaded again.
+    """
+
+    def __init__(
+        self, url: str = RATES_URL, timeout: float = 10.0, session: Any = None
+    ) -> None:
+        """
+        - url: Location of a JSON document with a "rates" dictionary.
+        - timeout: Seconds to wait for the server, bounds the refresh latency.
+        - session: Optional requests.Session to share.
+        """
+
+        self.url: str = url
+        self.timeout: float = timeout
+        self.session = session if session is not None else requests.Session()
+
+        # Validators and rates of the last response.
+        self.etag: str = ""
+        self.modified: str = ""
+        self.rates: dict = dict()
+
+    def fetch(self) -> dict:
+        headers = dict()
+
+        if self.rates:
+            if self.etag:
+                headers["If-None-Match"] = self.etag
+
+            if self.modified:
+                headers["If-Modified-Since"] = self.modified
+
+        response = self.session.get(self.url, headers=headers, timeout=self.timeout)
+
+        # Not modified.
+        if response.status_code == 304 and self.rates:
+            return dict(self.rates)
+
+        response.raise_for_status()
+
+        self.rates = response.json()["rates"]
+        self.etag = response.headers.get("ETag", "")
+        self.modified = response.headers.get("Last-Modified", "")
+
+        return dict(self.rates)
+
+
+class fileProvider(provider):
+    """
+    Reads rates from a local JSON file.
+
+    The file can either be a dictionary of rates or a document with a "rates" dictionary.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+
+    def fetch(self) -> dict:
+        with open(self.path, "r") as file:
+            data = json.load(file)
+
+        return dict(data["rates"] if "rates" in data else data)
+
+
+class stubProvider(provider):
+    """
+    Returns fixed rates, for testing and offline use.
+    """
+
+    def __init__(self, rates: dict) -> None:
+        self.rates: dict = dict(rates)
+
+        # Number of fetches served.
+        self.fetches: int = 0
+
+    def fetch(self) -> dict:
+        self.fetches += 1
+        return dict(self.rates)
@@ -1,7 +1,7 @@
 # Quantities.
 from __future__ import annotations
 
-from math import log, sqrt
+from fractions import Fraction
 from typing import Any
 
 from colorama import Style
@@ -16,19 +16,13 @@ from .exceptions import (
     UncertaintyComparisonError,
     UnpackError,
 )
-from .globals import logic, style
-from .tables import (
-    fetchCurrencies,
-    getBase,
-    getCurrencies,
-    getDerived,
-    getDerivedUnpacking,
-)
+from .globals import currencies, defined, logic, style
+from .propagation import kernelOf, uncertain
+from .tables import REGISTRY, exactPower, fetchCurrencies, getDerivedUnpacking
 from .tables import getFamily as gf
 from .tables import getRep
-from .utilities import checkIter
+from .utilities import cache, checkIter, parseUnit, signature
 from .utilities import dictFromUnit as dfu
-from .utilities import uAll, uAny
 from .utilities import unitFromDict as ufd
 
 """
@@ -42,8 +36,12 @@ us: short for units.
 class quantity:
     """
     misura's quantity class.
+
+    Slotted, units are held by an immutable signature shared among quantities.
     """
 
+    __slots__ = ("value", "uncertainty", "signature")
+
     def __init__(self, value: Any, unit: str = "", uncertainty: Any = 0) -> None:
         """
         Quantity initialization.
@@ -55,12 +53,13 @@ class quantity:
 
         try:
             assert isinstance(unit, str)
-            assert uAll(uncertainty >= 0)
-            assert (
-                (checkIter(value) == checkIter(uncertainty))
-                if uAny(uncertainty)
-                else True
-            )
+
+            # Checks are run by the uncertainty's kernel, vectorized for numpy arrays.
+            kernel = kernelOf(uncertainty)
+            uncertain = kernel.any(uncertainty)
+
+            assert kernel.valid(uncertainty)
+            assert (checkIter(value) == checkIter(uncertainty)) if uncertain else True
 
         except AssertionError:
             raise InitError(value, unit, uncertainty)
@@ -69,39 +68,63 @@ class quantity:
         self.value: Any = value
 
         # Uncertainty.
-        if not uAny(uncertainty):
+        if not uncertain:
             # For when value is iterable.
             self.uncertainty = 0 * self.value
 
         else:
             self.uncertainty = uncertainty
 
-        # Units of measure's table.
-        table: dict = getBase()
-        table.update(getDerived())
-
-        # From unit: str to self.units: dict.
-        self.units: dict = dfu(unit)
-        us = self.units.copy()
-
-        # Checks whether the quantity can be converted with the defined units.
-        self.convertible: bool = all(
-            [any([u in table[family] for family in table]) for u in us]
-        )
-
-        # Define quantity's dimentsions based on self.units.
-        self.dimensions: dict = (
-            {gf(u): self.units[u] for u in us} if self.convertible else dict()
-        )
+        # From unit: str to self.signature, shared among quantities with the same unit.
+        self.signature: signature = parseUnit(unit)
 
         # Checks currencies.
         if type(self) == quantity:
-            table: dict = getCurrencies()
-            if uAny(
-                [uAny([u in table[family] for u in self.units]) for family in table]
-            ):
+            if REGISTRY.describeUnits(self.signature)[3]:
                 raise MixingError()
 
+    @classmethod
+    def fromSignature(cls, value: Any, sig: signature, uncertainty: Any) -> quantity:
+        """
+        Builds a quantity from already validated parts, skipping every check.
+
+        Meant for the results of operations on valid quantities.
+        """
+
+        qnt = object.__new__(cls)
+
+        qnt.value = value
+        qnt.uncertainty = uncertainty
+        qnt.signature = sig
+
+        return qnt
+
+    # UNITS.
+
+    @property
+    def units(self) -> dict:
+        """
+        Quantity's units and their exponents, e.g. {"m": 1, "s": -1}.
+        """
+
+        return dict(self.signature.units)
+
+    @property
+    def convertible(self) -> bool:
+        """
+        Checks whether the quantity can be converted with the defined units.
+        """
+
+        return REGISTRY.describeUnits(self.signature)[1]
+
+    @property
+    def dimensions(self) -> dict:
+        """
+        Quantity's families and their exponents, e.g. {"length": 1, "time": -1}.
+        """
+
+        return dict(REGISTRY.describeUnits(self.signature)[2])
+
     # PRINTERS.
 
     # this is unique as per 'sorted'.
@@ -113,16 +136,17 @@ class quantity:
         'print = True' makes the output fancier.
         """
 
-        if not len(self.units):
-            return ""
-
-        us: dict = self.units.copy()
-
         if not print:
             # Plain version.
             # {"m": 1, "s": -1} -> "m s-1".
             # The plain version is the same as the definition one.
-            return ufd(self.units)
+            # Signatures compute it once.
+            return self.signature.unit
+
+        if not len(self.units):
+            return ""
+
+        us: dict = self.units.copy()
 
         # Fancy version.
         # {"m": 1, "s": -1} -> "[m / s]".
@@ -193,7 +217,7 @@ class quantity:
 
         return "{}{}{}".format(
             self.value,
-            "{}{}".format(pm, uncert) if uAny(uncert) else "",
+            "{}{}".format(pm, uncert) if uncertain(uncert) else "",
             (" " + unit) if self.units else "",
         )
 
@@ -208,7 +232,7 @@ class quantity:
         # This works best with print.
         return (
             self.value.__format__(string)
-            + ((pm + uncert.__format__(string)) if uAny(uncert) else "")
+            + ((pm + uncert.__format__(string)) if uncertain(uncert) else "")
             + ((" " + unit) if self.units else "")
         )
 
@@ -229,58 +253,72 @@ class quantity:
 
     # Bool.
     def __bool__(self) -> bool:
-        return bool(uAny(self.value) or uAny(self.uncertainty))
+        return bool(uncertain(self.value) or uncertain(self.uncertainty))
 
     # MATH.
 
     # Abs.
     def __abs__(self) -> quantity:
         # Ignores the case in which abs(uncertainty) > abs(value).
-        return quantity(abs(self.value), self.unit(), self.uncertainty)
+        return quantity.fromSignature(abs(self.value), self.signature, self.uncertainty)
 
     # Positive.
     def __pos__(self) -> quantity:
-        return quantity(+self.value, self.unit(), self.uncertainty)
+        return quantity.fromSignature(+self.value, self.signature, self.uncertainty)
 
     # Negative.
     def __neg__(self) -> quantity:
-        return quantity(-self.value, self.unit(), self.uncertainty)
+        return quantity.fromSignature(-self.value, self.signature, self.uncertainty)
 
     # Round.
     def __round__(self, number: int) -> quantity:
-        return quantity(
-            round(self.value, number), self.unit(), round(self.uncertainty, number + 1)
+        return quantity.fromSignature(
+            round(self.value, number),
+            self.signature,
+            round(self.uncertainty, number + 1),
         )
 
     # Floor.
     def __floor__(self) -> quantity:
         from math import floor
 
-        return quantity(floor(self.value), self.unit(), floor(self.uncertainty))
+        return quantity.fromSignature(
+            floor(self.value), self.signature, floor(self.uncertainty)
+        )
 
     # Ceil.
     def __ceil__(self) -> quantity:
         from math import ceil
 
-        return quantity(ceil(self.value), self.unit(), ceil(self.uncertainty))
+        return quantity.fromSignature(
+            ceil(self.value), self.signature, ceil(self.uncertainty)
+        )
 
     # Trunc.
     def __trunc__(self) -> quantity:
         from math import trunc
 
-        return quantity(trunc(self.value), self.unit(), trunc(self.uncertainty))
+        return quantity.fromSignature(
+            trunc(self.value), self.signature, trunc(self.uncertainty)
+        )
 
     # Addition.
     def __add__(self, other: Any) -> quantity:
+        # Unit-aware arrays handle mixed operations.
+        if isArray(other):
+            return NotImplemented
+
         if not isinstance(other, quantity):
             # Addition between pure numbers.
             if self.unit():
                 raise QuantityError(self, quantity(other, ""), "+")
 
-            return quantity(self.value + other, "", self.uncertainty)
+            return quantity.fromSignature(
+                self.value + other, self.signature, self.uncertainty
+            )
 
         if not compare(self, other):
-            if self.convertible and other.convertible:
+            if compatible(self, other):
                 # Chooses the one to convert based on unit length.
                 first = convert(self, other.unit())
                 second = convert(other, self.unit())
@@ -291,13 +329,24 @@ class quantity:
                     else (self, second)
                 )
 
+            elif self.convertible and other.convertible:
+                raise ConversionError(self, other.unit())
+
             else:
                 raise QuantityError(self, other, "+")
 
-        return quantity(
-            self.value + other.value,
-            self.unit(),
-            sqrt(self.uncertainty**2 + other.uncertainty**2),
+        value = self.value + other.value
+
+        kernel = kernelOf(self.uncertainty, other.uncertainty)
+
+        # Exact operands give an exact result.
+        if not kernel.any(self.uncertainty) and not kernel.any(other.uncertainty):
+            return quantity.fromSignature(value, self.signature, 0 * value)
+
+        return quantity.fromSignature(
+            value,
+            self.signature,
+            kernel.quadrature(self.uncertainty, other.uncertainty),
         )
 
     def __radd__(self, other: quantity) -> quantity:
@@ -305,15 +354,21 @@ class quantity:
 
     # Subtraction.
     def __sub__(self, other: Any) -> quantity:
+        # Unit-aware arrays handle mixed operations.
+        if isArray(other):
+            return NotImplemented
+
         if not isinstance(other, quantity):
             # Subtraction between pure numbers.
             if self.unit():
                 raise QuantityError(self, quantity(other, ""), "-")
 
-            return quantity(self.value - other, "", self.uncertainty)
+            return quantity.fromSignature(
+                self.value - other, self.signature, self.uncertainty
+            )
 
         if not compare(self, other):
-            if self.convertible and other.convertible:
+            if compatible(self, other):
                 # Chooses the one to convert based on unit length.
                 first = convert(self, other.unit())
                 second = convert(other, self.unit())
@@ -324,13 +379,24 @@ class quantity:
                     else (self, second)
                 )
 
+            elif self.convertible and other.convertible:
+                raise ConversionError(self, other.unit())
+
             else:
                 raise QuantityError(self, other, "-")
 
-        return quantity(
-            self.value - other.value,
-            self.unit(),
-            sqrt(self.uncertainty**2 + other.uncertainty**2),
+        value = self.value - other.value
+
+        kernel = kernelOf(self.uncertainty, other.uncertainty)
+
+        # Exact operands give an exact result.
+        if not kernel.any(self.uncertainty) and not kernel.any(other.uncertainty):
+            return quantity.fromSignature(value, self.signature, 0 * value)
+
+        return quantity.fromSignature(
+            value,
+            self.signature,
+            kernel.quadrature(self.uncertainty, other.uncertainty),
         )
 
     def __rsub__(self, other: quantity) -> quantity:
@@ -338,30 +404,34 @@ class quantity:
 
     # Multiplication.
     def __mul__(self, other: Any) -> any:
+        # Unit-aware arrays handle mixed operations.
+        if isArray(other):
+            return NotImplemented
+
         if not isinstance(other, quantity):
-            return quantity(
-                self.value * other, self.unit(), abs(self.uncertainty * other)
+            return quantity.fromSignature(
+                self.value * other, self.signature, abs(self.uncertainty * other)
             )
 
-        newUnits = self.units.copy()
+        factor, sig = product(self.signature, other, 1)
 
-        if self.convertible and other.convertible:
-            other = convert(other, self.unit(), partial=True)
+        # Converts other's units of the same families as self's ones.
+        if factor is not None:
+            other = scaled(other, factor)
 
-        for unit in newUnits:
-            if unit in other.units:
-                newUnits[unit] += other.units[unit]
+        value = self.value * other.value
 
-        for unit in other.units:
-            if unit not in newUnits:
-                newUnits[unit] = other.units[unit]
+        kernel = kernelOf(self.uncertainty, other.uncertainty)
 
-        return quantity(
-            self.value * other.value,
-            ufd(newUnits),
-            sqrt(
-                (other.value * self.uncertainty) ** 2
-                + (self.value * other.uncertainty) ** 2
+        # Exact operands give an exact result.
+        if not kernel.any(self.uncertainty) and not kernel.any(other.uncertainty):
+            return quantity.fromSignature(value, sig, 0 * value)
+
+        return quantity.fromSignature(
+            value,
+            sig,
+            kernel.quadrature(
+                other.value * self.uncertainty, self.value * other.uncertainty
             ),
         )
 
@@ -370,36 +440,41 @@ class quantity:
 
     # Division.
     def __truediv__(self, other: Any) -> any:
+        # Unit-aware arrays handle mixed operations.
+        if isArray(other):
+            return NotImplemented
+
         if not isinstance(other, quantity):
-            return quantity(
-                self.value / other, self.unit(), abs(self.uncertainty / other)
+            return quantity.fromSignature(
+                self.value / other, self.signature, abs(self.uncertainty / other)
             )
 
-        newUnits = self.units.copy()
+        factor, sig = product(self.signature, other, -1)
 
-        if self.convertible and other.convertible:
-            other = convert(other, self.unit(), partial=True)
+        # Converts other's units of the same families as self's ones.
+        if factor is not None:
+            other = scaled(other, factor)
 
-        for unit in newUnits:
-            if unit in other.units:
-                newUnits[unit] -= other.units[unit]
+        value = self.value / other.value
 
-        for unit in other.units:
-            if unit not in newUnits:
-                newUnits[unit] = -other.units[unit]
+        kernel = kernelOf(self.uncertainty, other.uncertainty)
 
-        return quantity(
-            self.value / other.value,
-            ufd(newUnits),
-            sqrt(
-                (self.uncertainty / other.value) ** 2
-                + (self.value * other.uncertainty / (other.value**2)) ** 2
+        # Exact operands give an exact result.
+        if not kernel.any(self.uncertainty) and not kernel.any(other.uncertainty):
+            return quantity.fromSignature(value, sig, 0 * value)
+
+        return quantity.fromSignature(
+            value,
+            sig,
+            kernel.quadrature(
+                self.uncertainty / other.value,
+                self.value * other.uncertainty / (other.value**2),
             ),
         )
 
     def __floordiv__(self, other: Any) -> quantity:
-        return quantity(
-            self.value // other, self.unit(), abs(self.uncertainty // other)
+        return quantity.fromSignature(
+            self.value // other, self.signature, abs(self.uncertainty // other)
         )
 
     def __rtruediv__(self, other: Any) -> any:
@@ -416,22 +491,19 @@ class quantity:
         if other == 1:
             return self
 
-        newUnits = self.units.copy()
-
-        for unit in newUnits:
-            newUnits[unit] *= other
-
-        return quantity(
+        return quantity.fromSignature(
             self.value**other,
-            ufd(newUnits),
-            abs(other) * (self.value ** (other - 1)) * self.uncertainty,
+            power(self.signature, other),
+            abs(other * (self.value ** (other - 1)) * self.uncertainty),
         )
 
     def __rpow__(self, other: Any) -> quantity:
         if isinstance(other, quantity):
             raise QuantityError(other, self, "**")
 
-        if uAny(other <= 0):
+        kernel = kernelOf(other)
+
+        if kernel.any(other <= 0):
             raise ValueError(
                 "math domain error\nraised on '{}' ** '{}'".format(other, self)
             )
@@ -439,111 +511,137 @@ class quantity:
         return quantity(
             other**self.value,
             "",
-            abs(log(other) * (other**self.value) * self.uncertainty),
+            abs(kernel.log(other) * (other**self.value) * self.uncertainty),
         ) * (other != 1) + quantity(1) * (other == 1)
 
     # Modulo.
     def __mod__(self, other: Any) -> quantity:
-        return quantity(self.value % other, self.unit(), self.uncertainty % other)
+        return quantity.fromSignature(
+            self.value % other, self.signature, self.uncertainty % other
+        )
 
     # COMPARISONS.
 
     # Less than.
     def __lt__(self, other: Any) -> quantity:
+        # Unit-aware arrays handle mixed operations.
+        if isArray(other):
+            return NotImplemented
+
         if not isinstance(other, quantity):
             return self.value < other
 
         if not compare(self, other):
-            if self.convertible and other.convertible:
+            if compatible(self, other):
                 other = convert(other, self.unit())
 
+            elif self.convertible and other.convertible:
+                raise ConversionError(other, self.unit())
+
             else:
                 raise QuantityError(self, other, "<")
 
-        if (
-            uAny(self.uncertainty) or uAny(self.uncertainty)
-        ) and not logic.ignoreUncertainty:
+        if uncertain(self.uncertainty) and not logic.ignoreUncertainty:
             raise UncertaintyComparisonError(self, other, "<")
 
         return self.value < other.value
 
     # Less or equal.
     def __le__(self, other: Any) -> quantity:
+        # Unit-aware arrays handle mixed operations.
+        if isArray(other):
+            return NotImplemented
+
         if not isinstance(other, quantity):
             return self.value <= other
 
         if not compare(self, other):
-            if self.convertible and other.convertible:
+            if compatible(self, other):
                 other = convert(other, self.unit())
 
+            elif self.convertible and other.convertible:
+                raise ConversionError(other, self.unit())
+
             else:
                 raise QuantityError(self, other, "<=")
 
-        if (
-            uAny(self.uncertainty) or uAny(self.uncertainty)
-        ) and not logic.ignoreUncertainty:
+        if uncertain(self.uncertainty) and not logic.ignoreUncertainty:
             raise UncertaintyComparisonError(self, other, "<=")
 
         return self.value <= other.value
 
     # Greater than.
     def __gt__(self, other: Any) -> quantity:
+        # Unit-aware arrays handle mixed operations.
+        if isArray(other):
+            return NotImplemented
+
         if not isinstance(other, quantity):
             return self.value > other
 
         if not compare(self, other):
-            if self.convertible and other.convertible:
+            if compatible(self, other):
                 other = convert(other, self.unit())
 
+            elif self.convertible and other.convertible:
+                raise ConversionError(other, self.unit())
+
             else:
                 raise QuantityError(self, other, ">")
 
-        if (
-            uAny(self.uncertainty) or uAny(self.uncertainty)
-        ) and not logic.ignoreUncertainty:
+        if uncertain(self.uncertainty) and not logic.ignoreUncertainty:
             raise UncertaintyComparisonError(self, other, ">")
 
         return self.value > other.value
 
     # Greater or equal.
     def __ge__(self, other: Any) -> quantity:
+        # Unit-aware arrays handle mixed operations.
+        if isArray(other):
+            return NotImplemented
+
         if not isinstance(other, quantity):
             return self.value >= other
 
         if not compare(self, other):
-            if self.convertible and other.convertible:
+            if compatible(self, other):
                 other = convert(other, self.unit())
 
+            elif self.convertible and other.convertible:
+                raise ConversionError(other, self.unit())
+
             else:
                 raise QuantityError(self, other, ">=")
 
-        if (
-            uAny(self.uncertainty) or uAny(self.uncertainty)
-        ) and not logic.ignoreUncertainty:
+        if uncertain(self.uncertainty) and not logic.ignoreUncertainty:
             raise UncertaintyComparisonError(self, other, ">=")
 
         return self.value >= other.value
 
     # Equal.
     def __eq__(self, other: Any) -> quantity:
+        # Unit-aware arrays handle mixed operations.
+        if isArray(other):
+            return NotImplemented
+
         if not isinstance(other, quantity):
             return self.value == other
 
-        if (
-            uAny(self.uncertainty) or uAny(self.uncertainty)
-        ) and not logic.ignoreUncertainty:
+        if uncertain(self.uncertainty) and not logic.ignoreUncertainty:
             raise UncertaintyComparisonError(self, other, "==")
 
         return self.value == other.value and compare(self, other)
 
     # Not equal.
     def __ne__(self, other: Any) -> quantity:
+        # Unit-aware arrays handle mixed operations.
+        if isArray(other):
+            return NotImplemented
+
         if not isinstance(other, quantity):
             return self.value != other
 
-        if (
-            uAny(self.uncertainty) or uAny(self.uncertainty)
-        ) and not logic.ignoreUncertainty:
+        if uncertain(self.uncertainty) and not logic.ignoreUncertainty:
             raise UncertaintyComparisonError(self, other, "!=")
 
         return self.value != other.value or not compare(self, other)
@@ -580,68 +678,178 @@ def convert(
     from .currencies import currency
 
     if isinstance(qnt, currency):
-        partial = False
-        un_pack = False
+        # A background refresher keeps the rates up to date.
+        if not currencies.background:
+            fetchCurrencies()  # Checks conversion rates.
 
-        fetchCurrencies()  # Checks conversion rates.
-        table: dict = getCurrencies()
+        # Refreshes swap the whole table, so this is a consistent snapshot.
+        rates: dict = REGISTRY.currencies
 
-    else:
-        table: dict = getBase()
-        table.update(getDerived())
+        if targets not in rates:
+            raise ConversionError(qnt, targets)
+
+        # Rates change on fetching, currency plans are not cached.
+        return currency.fromSignature(
+            kernelOf(qnt.value).scale(qnt.value, rates[qnt.unit()] / rates[targets]),
+            parseUnit(targets),
+        )
+
+    factor, sig = conversion(qnt, targets, partial, un_pack)
+    kernel = kernelOf(qnt.value, qnt.uncertainty)
+
+    return quantity.fromSignature(
+        kernel.scale(qnt.value, factor), sig, kernel.scale(qnt.uncertainty, factor)
+    )
+
+
+# Batch conversion function.
+def batchConvert(
+    items: Any,
+    targets: str,
+    partial: bool = False,
+    un_pack: bool = True,
+    array: bool = False,
+) -> Any:
+    """
+    Batch conversion function; converts the passed quantity objects to the specified target units.
+
+    Items are grouped by unit, so every distinct unit is planned once.
+    Returns a list, or a single misura.arrays.quantityArray if "array = True" (requires numpy).
+
+    In lists, instances of other quantity classes are converted through their own cto.
+    In arrays, every item only contributes its value and uncertainty.
+    """
+
+    from .currencies import currency
+
+    items = list(items)
+
+    # Distinct units, the first item of each and, for every item, the index of its unit.
+    groups: dict = dict()
+    firsts: list = []
+    indices: list = []
+
+    for item in items:
+        key = (type(item), item.signature)
+
+        if key not in groups:
+            groups[key] = len(groups)
+            firsts.append(item)
+
+        indices.append(groups[key])
+
+    plans: list = []
+
+    for item in firsts:
+        if isinstance(item, currency):
+            # Rates change on fetching, a unit currency gives the current rate.
+            try:
+                result = convert(type(item).fromSignature(1.0, item.signature), targets)
+
+            except ConversionError:
+                raise ConversionError(item, targets)
+
+            plans.append((result.value, result.signature))
+
+        else:
+            plans.append(conversion(item, targets, partial, un_pack))
+
+    if array:
+        return arrayConvert(items, indices, plans, targets)
+
+    converted: list = []
+
+    for item, index in zip(items, indices):
+        # Other kinds, e.g. correlated or sampled quantities, carry more than a value.
+        if type(item) is not quantity and type(item) is not currency:
+            converted.append(item.cto(targets, partial, un_pack))
+            continue
+
+        factor, sig = plans[index]
+        kernel = kernelOf(item.value, item.uncertainty)
+
+        converted.append(
+            type(item).fromSignature(
+                kernel.scale(item.value, factor),
+                sig,
+                kernel.scale(item.uncertainty, factor),
+            )
+        )
+
+    return converted
+
+
+def arrayConvert(items: list, indices: list, plans: list, targets: str) -> Any:
+    """
+    Builds a single quantity array out of batch conversion plans.
+    """
+
+    import numpy as np
+
+    from .arrays import quantityArray
+
+    # Empty batches hold the target units.
+    signatures = {sig for _, sig in plans} or {parseUnit(targets)}
+
+    # A single array holds a single unit.
+    if len(signatures) > 1:
+        raise ConversionError(items[0], ", ".join(sig.unit for sig in signatures))
+
+    if any(REGISTRY.describeUnits(sig)[3] for sig in signatures):
+        raise MixingError()
+
+    factors = np.array([factor for factor, _ in plans], dtype=float)[indices]
+
+    values = np.array([item.value for item in items], dtype=float) * factors
+    uncertainties = np.array([item.uncertainty for item in items], dtype=float)
+
+    return quantityArray.fromSignature(
+        values,
+        signatures.pop(),
+        uncertainties * factors if uncertainties.any() else None,
+    )
+
+
+# Cached conversion plans.
+def conversion(
+    qnt: quantity, targets: str, partial: bool = False, un_pack: bool = True
+) -> tuple:
+    """
+    Returns the multiplicative factor and the resulting signature converting the passed quantity object to the specified target units.
+    """
+
+    key = (qnt.signature.units, targets, partial, un_pack)
+    cached = PLANS.get(key)
+
+    # Plans computed before a definition may have missed the newly defined units.
+    if cached is None or cached[0] != defined.generation:
+        factor, unit = plan(qnt, targets, partial, un_pack)
+        cached = (defined.generation, factor, parseUnit(unit))
+        PLANS.set(key, cached)
+
+    return cached[1], cached[2]
+
+
+# Conversion plans.
+def plan(qnt: quantity, targets: str, partial: bool, un_pack: bool) -> tuple:
+    """
+    Computes the conversion plan of the passed quantity object to the specified target units.
+
+    Returns the multiplicative factor and the resulting unit.
+    """
 
     # Cannot convert non-convertible units.
     if not qnt.convertible:
         raise ConversionError(qnt, targets)
 
     # Check dimension.
-    if not partial and not isinstance(qnt, currency):
-        # Currencies cannot be unpacked but are always compatible.
-        if unpack(qnt).dimension() != unpack(quantity(1, targets)).dimension():
+    if not partial:
+        if REGISTRY.vector(qnt.signature) != REGISTRY.vector(parseUnit(targets)):
             raise ConversionError(qnt, targets)
 
-    # Automatic (un)packing, version 2.
+    # Automatic (un)packing, version 3.
     if un_pack and not partial:
-        # Tries to pack qnt.
-        target = quantity(1, targets)
-        packUnits = {u: target.units[u] for u in target.units if u not in qnt.units}
-        ignoreUnits = {u: qnt.units[u] for u in qnt.units if u not in target.units}
-
-        for tr in range(3):
-            try:
-                if tr == 0:
-                    # First try: uses ignore and full packing.
-                    return convert(
-                        pack(qnt, ufd(packUnits), ignore=ufd(ignoreUnits), full=True),
-                        targets,
-                        un_pack=False,
-                    )
-
-                if tr == 1:
-                    # Second try: uses ignore.
-                    return convert(
-                        pack(qnt, ufd(packUnits), ignore=ufd(ignoreUnits)),
-                        targets,
-                        un_pack=False,
-                    )
-
-                elif tr == 2:
-                    # Third try: does not use ignore.
-                    return convert(
-                        pack(qnt, ufd(packUnits)),
-                        targets,
-                        un_pack=False,
-                    )
-
-            except (PackError, ConversionError):
-                pass
-
-        # Completely unpacks units.
-        return convert(
-            unpack(qnt),
-            unpack(target).unit(),
-            un_pack=False,
-        )
+        return solve(qnt.signature, parseUnit(targets)), targets
 
     factor: float = 1.0
     tUnits: dict = dfu(targets)  # Target units.
@@ -652,7 +860,7 @@ def convert(
         family = gf(unit)
 
         # Number of corresponding families.
-        families = len([tgt for tgt in tUnits if tgt in table[family]])
+        families = len([tgt for tgt in tUnits if gf(tgt) == family])
 
         # Check target presence if not partial.
         if families == 0 and not partial:
@@ -664,7 +872,7 @@ def convert(
             continue
 
         # Target.
-        target = [tgt for tgt in tUnits if tgt in table[family]].pop()
+        target = [tgt for tgt in tUnits if gf(tgt) == family].pop()
 
         # Too many units: errror.
         if families > 1:
@@ -676,7 +884,9 @@ def convert(
 
         # Conversion.
         elif unit != target and qnt.units[unit] == tUnits[target]:
-            factor *= (table[family][unit] / table[family][target]) ** qnt.units[unit]
+            factor *= (
+                REGISTRY.factor(unit) / REGISTRY.factor(target)
+            ) ** qnt.units[unit]
             pTargets[target] = tUnits[target]
             continue
 
@@ -684,14 +894,26 @@ def convert(
         elif partial:
             pTargets[unit] = qnt.units[unit]
 
-    if isinstance(qnt, currency):
-        return currency(qnt.value * factor, targets)
+    return factor, targets if not partial else ufd(pTargets)
 
-    return (
-        quantity(qnt.value * factor, targets, qnt.uncertainty * factor)
-        if not partial
-        else quantity(qnt.value * factor, ufd(pTargets), qnt.uncertainty * factor)
-    )
+
+# Packing solver.
+def solve(source: signature, target: signature) -> float:
+    """
+    Packing solver; returns the factor converting the source units to the target ones.
+
+    Signatures sharing the same dimension vector can always be (un)packed into each other
+    by going through the base reps, so the factor is the ratio of their scales.
+    """
+
+    key = (source, target)
+    factor = SOLUTIONS.get(key)
+
+    if factor is None:
+        factor = float(REGISTRY.scale(source) / REGISTRY.scale(target))
+        SOLUTIONS.set(key, factor)
+
+    return factor
 
 
 # Unpacking function.
@@ -707,51 +929,71 @@ def unpack(qnt: quantity, targets: str = "") -> quantity:
     if isinstance(qnt, currency):
         raise CurrencyPackingError(qnt)
 
-    unpackTable: dict = getDerivedUnpacking()
-    derivedTable: dict = getDerived()
+    key = (qnt.signature, targets)
+    cached = UNPACKS.get(key)
+
+    if cached is None or cached[0] != defined.generation:
+        factor, unit = unpackPlan(qnt, targets)
+        cached = (defined.generation, factor, None if unit is None else parseUnit(unit))
+        UNPACKS.set(key, cached)
+
+    # Nothing to unpack.
+    if cached[2] is None:
+        return qnt
+
+    # Uncertainty scales as the value does.
+    kernel = kernelOf(qnt.value, qnt.uncertainty)
+
+    return quantity.fromSignature(
+        kernel.scale(qnt.value, cached[1]),
+        cached[2],
+        kernel.scale(qnt.uncertainty, cached[1]),
+    )
+
+
+# Unpacking plans.
+def unpackPlan(qnt: quantity, targets: str) -> tuple:
+    """
+    Computes the unpacking plan of the passed targets units from the quantity object.
+
+    Returns the multiplicative factor and the resulting unit, None if nothing gets unpacked.
+    """
+
+    us: dict = qnt.units.copy()
+    factor: Fraction = Fraction(1)
 
     if not targets:  # Unpacks all derived units.
-        us: dict = qnt.units.copy()
+        # Derived units that cannot be unpacked are left as they are.
+        tUnits = [u for u in us if REGISTRY.derived(u) and REGISTRY.expansion(u)]
 
-        targets = " ".join([u for u in us if gf(u) in derivedTable])
+    else:
+        tUnits = list(dfu(targets))
 
-    for target in dfu(targets):
-        us: dict = qnt.units.copy()
+    if not tUnits:
+        return 1.0, None
 
+    for target in tUnits:
         # Checks target.
-        if gf(target) not in [gf(u) for u in us]:
+        matches = [u for u in us if gf(u) == gf(target)] if gf(target) else []
+
+        if not matches:
             raise UnpackError(qnt, target)
 
-        cTarget = getRep(gf(target))  # Conversion target.
-        cTargetPower = [  # Conversion target's power.
-            us[u] for u in us if gf(u) == gf(target)
-        ].pop()
+        unit = matches.pop()
 
         # Raises an error if the program does not know how to unpack a unit.
-        if cTarget not in unpackTable:
+        if not REGISTRY.derived(unit) or not REGISTRY.expansion(unit):
             raise UnpackError(qnt, target)
 
-        # Converts the quantity to an unpackable one.
-        qnt = convert(
-            qnt,
-            cTarget + str(cTargetPower),
-            partial=True,
-            un_pack=False,
-        )
+        scale, expanded = REGISTRY.expansion(unit)
+        power = us.pop(unit)
 
-        us: dict = qnt.units.copy()
+        factor *= exactPower(scale, power)
 
-        # Units that werent't involved in the previous conversion.
-        newUnits = {u: us[u] for u in us if u != cTarget}
+        for u in expanded:
+            factor *= REGISTRY.merge(us, u, expanded[u] * power)
 
-        # Uncertainty should not vary on packing.
-        uncertainty = qnt.uncertainty
-        qnt = (quantity(qnt.value, ufd(newUnits)) if len(newUnits) else qnt.value) * (
-            quantity(1, unpackTable[cTarget]) ** us[cTarget]
-        )
-        qnt.uncertainty = uncertainty
-
-    return qnt
+    return float(factor), ufd(us)
 
 
 # Packing function.
@@ -769,17 +1011,12 @@ def pack(qnt: quantity, targets: str, ignore: str = "", full: bool = False) -> q
 
     packTable: dict = getDerivedUnpacking()
 
-    unitsTable: dict = getBase()
-    unitsTable.update(getDerived())
-
     if targets == "":
         raise PackError(qnt, "")
 
     # Simplify qnt -> base unit.
     for unit in qnt.units:
-        cTarget = [
-            unit for unit in unitsTable[gf(unit)] if unitsTable[gf(unit)][unit] == 1
-        ].pop()
+        cTarget = getRep(gf(unit))
         qnt = convert(qnt, cTarget + str(qnt.units[unit]), partial=True, un_pack=False)
 
     # Unpack only relevant units.
@@ -843,6 +1080,95 @@ def pack(qnt: quantity, targets: str, ignore: str = "", full: bool = False) -> q
 # QUANTITIES UTILITIES.
 
 
+# Result signatures.
+def product(first: signature, other: quantity, sign: int) -> tuple:
+    """
+    Returns the factor applied to other and the resulting signature
+    of a multiplication (sign = 1) or a division (sign = -1) by other.
+
+    Other's units of the same families as the first's ones are converted to them,
+    the factor is None when no conversion applies.
+    """
+
+    second = other.signature
+    key = (first, second, sign)
+    cached = PRODUCTS.get(key)
+
+    if cached is None or cached[0] != defined.generation:
+        factor, converted = None, second
+
+        if REGISTRY.describeUnits(first)[1] and REGISTRY.describeUnits(second)[1]:
+            factor, converted = conversion(other, first.unit, partial=True)
+
+        units = dict(first.units)
+
+        for u, exponent in converted.units:
+            units[u] = units.get(u, 0) + sign * exponent
+
+        cached = (defined.generation, factor, parseUnit(ufd(units)))
+        PRODUCTS.set(key, cached)
+
+    return cached[1], cached[2]
+
+
+def power(sig: signature, exponent: Any) -> signature:
+    """
+    Returns the signature of sig raised to exponent.
+    """
+
+    try:
+        key = (sig, exponent, type(exponent))
+        cached = POWERS.get(key)
+
+    except TypeError:  # Unhashable exponents.
+        return parseUnit(ufd({u: p * exponent for u, p in sig.units}))
+
+    if cached is None:
+        cached = parseUnit(ufd({u: p * exponent for u, p in sig.units}))
+        POWERS.set(key, cached)
+
+    return cached
+
+
+# Scales a quantity's value and uncertainty.
+def scaled(qnt: quantity, factor: float) -> quantity:
+    kernel = kernelOf(qnt.value, qnt.uncertainty)
+
+    return quantity.fromSignature(
+        kernel.scale(qnt.value, factor),
+        qnt.signature,
+        kernel.scale(qnt.uncertainty, factor),
+    )
+
+
+# Checks whether an object is a unit-aware array, e.g. misura.arrays.quantityArray.
+def isArray(other: Any) -> bool:
+    return type(other) in ARRAYS
+
+
 # Compares units of measure between two quantities.
 def compare(first: quantity, second: quantity) -> bool:
-    return first.unit() == second.unit()
+    return first.signature == second.signature
+
+
+# Compares dimensions between two quantities.
+def compatible(first: quantity, second: quantity) -> bool:
+    vector = REGISTRY.vector(first.signature)
+    return vector is not None and vector == REGISTRY.vector(second.signature)
+
+
+# Conversion plans' cache.
+PLANS = cache(4096)
+
+# Unpacking plans' cache.
+UNPACKS = cache(4096)
+
+# Packing solutions' cache.
+SOLUTIONS = cache(4096)
+
+# Result signatures' caches.
+PRODUCTS = cache(4096)
+POWERS = cache(4096)
+
+# Unit-aware array types, registered by misura.arrays.
+ARRAYS = set()
@@ -0,0 +1,235 @@
+# Sampling.
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from .exceptions import MixingError
+from .globals import sampling
+from .quantities import convert, pack, quantity, unpack
+from .tables import REGISTRY
+from .utilities import parseUnit
+
+"""
+Monte Carlo uncertainty propagation.
+
+Requires numpy.
+"""
+
+
+class sampled(quantity):
+    """
+    misura's sampled quantity class.
+
+    Carries a block of sampling.count draws of its value. Operators act on whole blocks,
+    so nonlinear formulas are propagated without linearization. The value and the uncertainty
+    are the mean and the standard deviation of the draws, computed on first access.
+
+    Uncertain quantities that are not sampled ones are drawn from normal distributions when mixed in.
+    """
+
+    __slots__ = ("samples", "statistics")
+
+    def __init__(self, value: Any, unit: str = "", uncertainty: Any = 0) -> None:
+        """
+        Sampled quantity initialization, draws from a normal distribution.
+
+        - value: A number, the distribution's mean.
+        - unit: A properly formatted string including all the units with their exponents. e.g. "m s-1".
+        - uncertainty: The distribution's standard deviation.
+        """
+
+        # Value and uncertainty are set as draws, see the properties below.
+        super().__init__(value, unit, uncertainty)
+
+        # Checks currencies.
+        if REGISTRY.describeUnits(self.signature)[3]:
+            raise MixingError()
+
+    @classmethod
+    def fromSamples(cls, samples: Any, unit: str = "") -> sampled:
+        """
+        Builds a sampled quantity from arbitrary draws, e.g. from a uniform distribution.
+        """
+
+        smp = cls.fromBlock(np.asarray(samples, dtype=float), parseUnit(unit))
+
+        # Checks currencies.
+        if REGISTRY.describeUnits(smp.signature)[3]:
+            raise MixingError()
+
+        return smp
+
+    @classmethod
+    def fromBlock(cls, samples: np.ndarray, sig: Any) -> sampled:
+        """
+        Builds a sampled quantity from already validated parts, skipping every check.
+        """
+
+        smp = object.__new__(cls)
+
+        smp.samples = samples
+        smp.signature = sig
+        smp.statistics = None
+
+        return smp
+
+    # STATISTICS.
+
+    @property
+    def value(self) -> float:
+        return self.describe()[0]
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self.samples = np.full(sampling.count, value, dtype=float)
+        self.statistics = None
+
+    @property
+    def uncertainty(self) -> float:
+        return self.describe()[1]
+
+    @uncertainty.setter
+    def uncertainty(self, uncertainty: Any) -> None:
+        if uncertainty:
+            self.samples = self.samples + GENERATOR.normal(
+                0.0, uncertainty, self.samples.shape
+            )
+
+        self.statistics = None
+
+    def describe(self) -> tuple:
+        """
+        Returns the mean and the standard deviation of the draws.
+        """
+
+        if self.statistics is None:
+            self.statistics = (
+                float(np.mean(self.samples)),
+                float(np.std(self.samples, ddof=1)),
+            )
+
+        return self.statistics
+
+    def interval(self, coverage: float = 0.95) -> tuple:
+        """
+        Returns the bounds of the central interval holding coverage of the draws.
+
+        Unlike value ± uncertainty, intervals show the asymmetry of nonlinear results.
+        """
+
+        tail = (1 - coverage) / 2 * 100
+        lower, upper = np.percentile(self.samples, [tail, 100 - tail])
+
+        return (
+            quantity.fromSignature(float(lower), self.signature, 0.0),
+            quantity.fromSignature(float(upper), self.signature, 0.0),
+        )
+
+    # MATH.
+
+    def __abs__(self) -> sampled:
+        return block(quantity.__abs__(draws(self)))
+
+    def __pos__(self) -> sampled:
+        return block(quantity.__pos__(draws(self)))
+
+    def __neg__(self) -> sampled:
+        return block(quantity.__neg__(draws(self)))
+
+    def __add__(self, other: Any) -> sampled:
+        return block(quantity.__add__(draws(self), draws(other)))
+
+    def __radd__(self, other: Any) -> sampled:
+        return self.__add__(other)
+
+    def __sub__(self, other: Any) -> sampled:
+        return block(quantity.__sub__(draws(self), draws(other)))
+
+    def __rsub__(self, other: Any) -> sampled:
+        return -self.__sub__(other)
+
+    def __mul__(self, other: Any) -> sampled:
+        return block(quantity.__mul__(draws(self), draws(other)))
+
+    def __rmul__(self, other: Any) -> sampled:
+        return block(quantity.__mul__(draws(self), draws(other)))
+
+    def __truediv__(self, other: Any) -> sampled:
+        return block(quantity.__truediv__(draws(self), draws(other)))
+
+    def __rtruediv__(self, other: Any) -> sampled:
+        return block(quantity.__rtruediv__(draws(self), draws(other)))
+
+    def __pow__(self, other: Any) -> sampled:
+        # Every draw to the zeroth power is one.
+        if not isinstance(other, quantity) and other == 0:
+            return sampled.fromBlock(np.ones_like(self.samples), parseUnit(""))
+
+        return block(quantity.__pow__(draws(self), other))
+
+    def __rpow__(self, other: Any) -> sampled:
+        return block(quantity.__rpow__(draws(self), other))
+
+    # SHORTCUTS.
+
+    def cto(
+        self, targets: str, partial: bool = False, un_pack: bool = True
+    ) -> sampled:  # Convert to.
+        return block(convert(draws(self), targets, partial, un_pack))
+
+    def uto(self, targets: str = "") -> sampled:  # Unpack to.
+        return block(unpack(draws(self), targets))
+
+    def pto(
+        self, targets: str, ignore: str = "", full: bool = False
+    ) -> sampled:  # Pack to.
+        return block(pack(draws(self), targets, ignore, full))
+
+
+# Draws.
+
+
+def draws(item: Any) -> Any:
+    """
+    Returns an operand as an exact quantity whose value is a block of draws.
+    """
+
+    if isinstance(item, sampled):
+        return quantity.fromSignature(item.samples, item.signature, 0)
+
+    if isinstance(item, quantity):
+        samples = np.full(sampling.count, item.value, dtype=float)
+
+        if item.uncertainty:
+            samples += GENERATOR.normal(0.0, item.uncertainty, sampling.count)
+
+        return quantity.fromSignature(samples, item.signature, 0)
+
+    return item
+
+
+def block(result: Any) -> Any:
+    """
+    Wraps the result of an operation on blocks of draws.
+    """
+
+    # Lets the other operand's reflected operator run, e.g. for quantity arrays.
+    if result is NotImplemented:
+        return NotImplemented
+
+    return sampled.fromBlock(np.asarray(result.value, dtype=float), result.signature)
+
+
+def seed(value: Any = None) -> None:
+    """
+    Seeds the generator of the draws, for reproducible results.
+    """
+
+    global GENERATOR
+    GENERATOR = np.random.default_rng(value)
+
+
+# Generator of the draws.
+GENERATOR = np.random.default_rng()
@@ -1,12 +1,435 @@
 # Tables.
 import json
+from contextlib import contextmanager
+from fractions import Fraction
+from os import chmod, fdopen, makedirs, remove, replace, umask
+from os.path import dirname, exists
+from tempfile import mkstemp
+from threading import Lock
 from time import time
+from typing import Any
 
-import requests
+try:
+    import fcntl
+
+except ImportError:  # Windows.
+    import msvcrt
+
+    fcntl = None
 
 from .exceptions import DefinitionError
 from .globals import defined
-from .utilities import dictFromUnit
+from .providers import RATES_URL, httpProvider
+from .utilities import cache, dictFromUnit, parseUnit, signature
+
+# Registry.
+
+
+class registry:
+    """
+    Compiled index over the units of measure's tables.
+
+    Flattens the base, derived and currency tables so that looking up
+    a unit's family, factor and rep does not require scanning every family.
+    """
+
+    def __init__(self) -> None:
+        # unit -> (family, factor, derived).
+        self.units: dict = dict()
+
+        # family -> rep.
+        self.reps: dict = dict()
+
+        # currency -> factor.
+        self.currencies: dict = dict()
+
+        # Base dimension (family) -> position in dimension vectors.
+        self.bases: dict = dict()
+
+        # unit -> dimension vector.
+        self.vectors: dict = dict()
+
+        # derived unit -> (scale, base units).
+        self.expansions: dict = dict()
+
+        # unit -> factor with respect to the base reps.
+        self.scales: dict = dict()
+
+        # signature -> (generation, dimension vector, scale).
+        self.signatures: cache = cache(4096)
+
+        # signature -> (generation, convertible, dimensions, currencies).
+        self.traits: cache = cache(4096)
+
+        self.compiled: bool = False
+
+        # Value of defined.generation the indices reflect.
+        self.generation: int = 0
+
+    def compile(self) -> None:
+        """
+        Builds the indices from the current tables.
+        """
+
+        self.units = dict()
+        self.reps = dict()
+        self.bases = dict()
+        self.vectors = dict()
+        self.expansions = dict()
+        self.scales = dict()
+        self.signatures.clear()
+
+        # Lookups made while compiling must not trigger a compilation.
+        self.compiled = True
+        self.generation = defined.generation
+
+        for table, derived in (
+            (SI_TABLE, False),
+            (defined.BASE_TABLE, False),
+            (SI_DERIVED_TABLE, True),
+            (defined.DERIVED_TABLE, True),
+        ):
+            self.index(table, derived)
+
+        # Currencies share a single dimension.
+        self.bases.setdefault("currency", len(self.bases))
+        self.compileCurrencies()
+
+        self.expand()
+
+    def update(self) -> None:
+        """
+        Indexes the families defined since the last compilation.
+        """
+
+        self.generation = defined.generation
+
+        # addUnit only adds new families, so already indexed ones are kept.
+        for table, derived in (
+            (defined.BASE_TABLE, False),
+            (defined.DERIVED_TABLE, True),
+        ):
+            self.index(
+                {family: table[family] for family in table if family not in self.reps},
+                derived,
+            )
+
+        self.expand()
+
+    def index(self, table: dict, derived: bool) -> None:
+        """
+        Adds the families of a table to the indices.
+        """
+
+        for family in table:
+            for u in table[family]:
+                # The first definition of a unit wins, as in scanning the tables.
+                self.units.setdefault(u, (family, table[family][u], derived))
+
+                if table[family][u] == 1:
+                    self.reps[family] = u
+
+            # Derived units that cannot be unpacked act as base dimensions.
+            # New dimensions are appended, so known vectors stay valid.
+            if not derived or self.reps[family] not in getDerivedUnpacking():
+                self.bases.setdefault(family, len(self.bases))
+
+    def expand(self) -> None:
+        """
+        Precomputes the expansions of the derived units.
+        """
+
+        for u in self.units:
+            if self.units[u][2]:
+                self.expansion(u)
+
+    def dimension(self, unit: str) -> tuple:
+        """
+        Returns the exponent vector of a convertible unit over the base dimensions.
+        """
+
+        if unit in self.vectors:
+            return self.vectors[unit]
+
+        family = self.family(unit)
+
+        if family in self.bases:
+            vector = [0] * self.bases[family] + [1]
+
+        else:
+            vector = []
+
+            for u, power in parseUnit(getDerivedUnpacking()[self.reps[family]]).units:
+                vector = addVectors(vector, self.dimension(u), power)
+
+        self.vectors[unit] = trimVector(vector)
+        return self.vectors[unit]
+
+    def expansion(self, unit: str) -> tuple:
+        """
+        Returns the full expansion of a derived unit into base units as (scale, units),
+        None if the unit cannot be unpacked.
+
+        e.g. "kJ" -> (1000.0, {"kg": 1, "m": 2, "s": -2}).
+        """
+
+        if unit in self.expansions:
+            return self.expansions[unit]
+
+        family, factor, derived = self.units[unit]
+        unpacking = getDerivedUnpacking()
+
+        if not derived or self.reps[family] not in unpacking:
+            return None
+
+        scale = exact(factor)
+        units: dict = dict()
+
+        for u, power in parseUnit(unpacking[self.reps[family]]).units:
+            expanded = self.expansion(u) if self.derived(u) else None
+
+            if expanded is None:
+                scale *= self.merge(units, u, power)
+                continue
+
+            # Derived units in unpackings get expanded as well.
+            scale *= exactPower(expanded[0], power)
+
+            for v in expanded[1]:
+                scale *= self.merge(units, v, expanded[1][v] * power)
+
+        self.expansions[unit] = (scale, units)
+        return self.expansions[unit]
+
+    def merge(self, units: dict, unit: str, power: Any) -> float:
+        """
+        Merges unit ** power into units, converting it to the unit of the same family if present.
+
+        Returns the exact factor produced by the conversion.
+        """
+
+        family = self.family(unit)
+        matches = [u for u in units if u != unit and self.family(u) == family]
+        factor = Fraction(1)
+
+        if family and matches:
+            target = matches[0]
+            factor = exactPower(
+                exact(self.factor(unit)) / exact(self.factor(target)), power
+            )
+            unit = target
+
+        units[unit] = units.get(unit, 0) + power
+
+        if not units[unit]:
+            del units[unit]
+
+        return factor
+
+    def coherent(self, unit: str) -> float:
+        """
+        Returns the exact factor of a convertible unit with respect to the base reps.
+
+        e.g. "kJ" -> 1000, as 1 kJ = 1000 kg m2 s-2.
+        """
+
+        if unit in self.scales:
+            return self.scales[unit]
+
+        scale = exact(self.factor(unit))
+        expanded = self.expansion(unit) if self.derived(unit) else None
+
+        if expanded is not None:
+            scale = expanded[0]
+
+            for u in expanded[1]:
+                scale *= exactPower(exact(self.factor(u)), expanded[1][u])
+
+        self.scales[unit] = scale
+        return scale
+
+    def describe(self, sig: signature) -> tuple:
+        """
+        Returns (generation, vector, scale) for a signature.
+        """
+
+        self.check()
+        cached = self.signatures.get(sig)
+
+        # Only non-convertible signatures may change on new definitions.
+        if cached is None or (cached[1] is None and cached[0] != self.generation):
+            vector = []
+            scale = Fraction(1)
+
+            for u, power in sig.units:
+                if u not in self.units and u not in self.currencies:
+                    vector = None
+                    break
+
+                vector = addVectors(vector, self.dimension(u), power)
+
+                # Currency rates change on fetching, their scale is not cached.
+                if scale is not None and u in self.units:
+                    scale *= exactPower(self.coherent(u), power)
+
+                else:
+                    scale = None
+
+            if vector is None:
+                scale = None
+
+            cached = (
+                self.generation,
+                trimVector(vector) if vector is not None else None,
+                scale,
+            )
+            self.signatures.set(sig, cached)
+
+        return cached
+
+    def vector(self, sig: signature) -> tuple:
+        """
+        Returns the exponent vector of a signature, None if it is not convertible.
+
+        Vectors are trimmed of trailing zeros, so that vectors computed before
+        the definition of new base units compare equal to the ones computed after.
+        """
+
+        return self.describe(sig)[1]
+
+    def scale(self, sig: signature) -> Fraction:
+        """
+        Returns the exact factor of a signature with respect to the base reps, None if it is not convertible.
+        """
+
+        return self.describe(sig)[2]
+
+    def describeUnits(self, sig: signature) -> tuple:
+        """
+        Returns (generation, convertible, dimensions, currencies) for a signature.
+
+        Computed once per signature and shared by every quantity with that unit.
+        """
+
+        self.check()
+        cached = self.traits.get(sig)
+
+        if cached is None or cached[0] != self.generation:
+            generation = self.generation
+            convertible = all([u in self.units for u, _ in sig.units])
+
+            dimensions = (
+                {self.family(u): power for u, power in sig.units} if convertible else {}
+            )
+
+            cached = (
+                generation,
+                convertible,
+                dimensions,
+                any([self.code(u) for u, _ in sig.units]),
+            )
+            self.traits.set(sig, cached)
+
+        return cached
+
+    def compileCurrencies(self) -> None:
+        """
+        Builds the currencies index from the current rates.
+        """
+
+        currencies = CURRENCIES_TABLE["currency"].copy()
+
+        # New currencies may make cached non-convertible signatures convertible.
+        if currencies.keys() != self.currencies.keys():
+            defined.generation += 1
+
+        self.currencies = currencies
+
+    def check(self) -> None:
+        """
+        Compiles the registry on its first use and updates it on new definitions.
+        """
+
+        if not self.compiled:
+            self.compile()
+
+        elif self.generation != defined.generation:
+            self.update()
+
+    def lookup(self, unit: str) -> tuple:
+        """
+        Returns (family, factor, derived) for a convertible unit or currency, None otherwise.
+        """
+
+        self.check()
+
+        if unit in self.units:
+            return self.units[unit]
+
+        if unit in self.currencies:
+            return ("currency", self.currencies[unit], False)
+
+        return None
+
+    def family(self, unit: str) -> str:
+        """
+        Returns the family of a convertible unit or currency, "" otherwise.
+        """
+
+        entry = self.lookup(unit)
+        return entry[0] if entry else ""
+
+    def factor(self, unit: str) -> float:
+        """
+        Returns the factor of a convertible unit or currency with respect to its rep.
+        """
+
+        return self.lookup(unit)[1]
+
+    def rep(self, family: str) -> str:
+        """
+        Returns the rep of a family of units, None for unknown families.
+        """
+
+        self.check()
+        return self.reps.get(family, None)
+
+    def convertible(self, unit: str) -> bool:
+        """
+        Checks whether a unit is a defined base or derived unit.
+        """
+
+        self.check()
+        return unit in self.units
+
+    def derived(self, unit: str) -> bool:
+        """
+        Checks whether a unit is a defined derived unit.
+        """
+
+        self.check()
+        return unit in self.units and self.units[unit][2]
+
+    def currency(self, unit: str) -> bool:
+        """
+        Checks whether a unit is a known currency.
+
+        Currencies are only known once their rates are loaded, checking does not load them.
+        """
+
+        self.check()
+        return unit in self.currencies
+
+    def code(self, unit: str) -> bool:
+        """
+        Checks whether a unit is a currency code, either from ISO 4217 or from the loaded rates.
+
+        Does not load the rates, so that quantities refuse currencies before their first use.
+        """
+
+        self.check()
+        return unit in CODES_TABLE or unit in self.currencies
+
 
 # Tables utilities
 
@@ -16,12 +439,7 @@ def getRep(family: str) -> str:
     Returns a reference unit given its family.
     """
 
-    table = getBase()
-    table.update(getDerived())
-
-    if family in table:
-        # This shouldn't raise an IndexError as long as there's a reference unit for every family.
-        return [u for u in table[family] if table[family][u] == 1].pop()
+    return REGISTRY.rep(family)
 
 
 def getFamily(unit: str) -> str:
@@ -29,15 +447,63 @@ def getFamily(unit: str) -> str:
     Returns the family of a convertible unit.
     """
 
-    table = getBase()
-    table.update(getDerived())
-    table.update(getCurrencies())
+    return REGISTRY.family(unit)
+
+
+# Vectors and scales utilities.
+
+
+def addVectors(first: list, second: tuple, power: Any = 1) -> list:
+    """
+    Returns first + power * second for dimension vectors of any length.
+    """
+
+    if len(first) < len(second):
+        first = list(first) + [0] * (len(second) - len(first))
+
+    else:
+        first = list(first)
+
+    for index, exponent in enumerate(second):
+        first[index] += power * exponent
+
+    return first
+
+
+def trimVector(vector: list) -> tuple:
+    """
+    Returns the canonical, hashable form of a dimension vector.
+    """
+
+    vector = list(vector)
+
+    while vector and vector[-1] == 0:
+        vector.pop()
+
+    return tuple(vector)
+
+
+def exact(number: Any) -> Fraction:
+    """
+    Returns the exact decimal value of a table's factor.
+
+    Scales are multiplied exactly so that chained prefixes do not accumulate
+    rounding errors, e.g. (0.1 ** 3) / (0.01 ** 3) is exactly 1000.
+    """
+
+    return Fraction(repr(number)) if isinstance(number, float) else Fraction(number)
 
-    for family in table:
-        if unit in table[family]:
-            return family
 
-    return ""
+def exactPower(base: Fraction, exponent: Any) -> Any:
+    """
+    Returns base ** exponent, exactly for integer exponents.
+    """
+
+    if isinstance(exponent, int) or float(exponent).is_integer():
+        return base ** int(exponent)
+
+    # Fractional powers cannot be exact.
+    return Fraction(float(base) ** exponent)
 
 
 # Tables functions.
@@ -83,30 +549,182 @@ def getCurrencies() -> dict:
 def fetchCurrencies() -> None:
     from .globals import currencies
 
+    if currencies.provider is None:
+        currencies.provider = httpProvider()
+
+    provider = currencies.provider
+
+    # Rates in memory are still valid and come from the current provider.
+    if time() < currencies.expiry and provider is currencies.source:
+        return
+
+    # A single thread at a time loads the rates.
+    # While it does, other threads keep using the last good rates, if any.
+    if not FETCHING.acquire(blocking=not CURRENCIES_TABLE["currency"]):
+        return
+
     try:
-        file = open(currencies.path, "r")
-        data = json.load(file)
+        # Rates may have been loaded while waiting.
+        if time() < currencies.expiry and provider is currencies.source:
+            return
+
+        fresh = False
+
+        # Only rates served over HTTP are shared through the rates file.
+        if isinstance(provider, httpProvider):
+            data = readRates(currencies.path, provider.url)
+
+            if data is None:
+                # Bare file names live in the working directory.
+                if dirname(currencies.path):
+                    makedirs(dirname(currencies.path), exist_ok=True)
+
+                # A single process at a time downloads the rates.
+                with lockFile(currencies.path + ".lock"):
+                    # Another process may have refreshed the rates while waiting.
+                    data = readRates(currencies.path, provider.url)
 
-        # Reload rates older than 6 hours.
-        if time() - data["time"] < 3600 * 6:
-            rates = data["rates"]
+                    if data is None:
+                        data = {
+                            "time": time(),
+                            "url": provider.url,
+                            "rates": provider.fetch(),
+                        }
+
+                        writeRates(currencies.path, data)
+                        fresh = True
 
         else:
-            raise FileNotFoundError
+            data = {"time": time(), "rates": provider.fetch()}
+            fresh = True
+
+        rates = data["rates"]
 
-    except (FileNotFoundError, json.JSONDecodeError):
-        rates = requests.get(
-            "https://misura.diantonioandrea.com/currencies/rates.json"
-        ).json()["rates"]
+        if fresh and currencies.history is not None:
+            currencies.history.ingest(rates, data["time"])
 
-        file = open(currencies.path, "w")
-        data = {"time": time(), "rates": rates}
-        json.dump(data, file)
+        # Swaps the whole table so that readers never see a partial update.
+        CURRENCIES_TABLE["currency"] = {curr: 1 / rates[curr] for curr in rates}
+        REGISTRY.compileCurrencies()
 
-    file.close()
+        # Rates expire along with the file they come from.
+        currencies.expiry = data["time"] + currencies.lifetime
+        currencies.source = provider
 
-    for curr in rates:
-        CURRENCIES_TABLE["currency"][curr] = 1 / rates[curr]
+    finally:
+        FETCHING.release()
+
+
+def readRates(path: str, url: str = RATES_URL) -> dict:
+    """
+    Returns the rates stored at path, None if missing, corrupted, older than 6 hours
+    or downloaded from a different url.
+    """
+
+    from .globals import currencies
+
+    try:
+        with open(path, "r") as file:
+            data = json.load(file)
+
+        # Files without an url come from misura's rates.
+        if data.get("url", RATES_URL) != url:
+            return None
+
+        if time() - data["time"] < currencies.lifetime:
+            return data
+
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
+    return None
+
+
+def writeRates(path: str, data: dict) -> None:
+    """
+    Atomically replaces the rates stored at path.
+
+    Rates are written to a temporary file which is then renamed, so that
+    concurrent readers see either the old or the new rates, never a partial file.
+    """
+
+    handle, temporary = mkstemp(
+        dir=dirname(path) or ".", prefix=".misura-", suffix=".json"
+    )
+
+    try:
+        with fdopen(handle, "w") as file:
+            json.dump(data, file, separators=(",", ":"))
+
+        # Temporary files are private, the rates are shared among users.
+        mask = umask(0)
+        umask(mask)
+        chmod(temporary, 0o644 & ~mask)
+
+        replace(temporary, path)
+
+    except BaseException:
+        if exists(temporary):
+            remove(temporary)
+
+        raise
+
+
+@contextmanager
+def lockFile(path: str):
+    """
+    Holds an exclusive lock on path, shared among processes.
+    """
+
+    file = open(path, "a+")
+
+    try:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+        else:  # Windows.
+            file.seek(0)
+
+            # msvcrt gives up after some attempts.
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+
+                except OSError:
+                    continue
+
+        yield
+
+    finally:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+        file.close()
+
+
+def loadCurrencies() -> None:
+    """
+    Loads currency rates on their first use.
+    """
+
+    from .globals import currencies
+
+    # Rates are only needed once misura.currencies has been imported.
+    if currencies.enabled and not CURRENCIES_TABLE["currency"]:
+        fetchCurrencies()
+
+
+def getMinorUnits(symbol: str) -> int:
+    """
+    Returns the number of decimal digits of a currency's minor unit.
+    """
+
+    return MINOR_UNITS_TABLE.get(symbol, 2)
 
 
 # Conversion tables.
@@ -117,9 +735,6 @@ def addUnit(family: str, units: dict, unpacks: str = ""):
     addUnit function, allows users to define new units.
     """
 
-    table = getBase()
-    table.update(getDerived())
-
     try:
         assert isinstance(family, str)
         assert isinstance(units, dict)
@@ -134,7 +749,7 @@ def addUnit(family: str, units: dict, unpacks: str = ""):
     family = family.lower()
 
     # Checks family.
-    if family in table:
+    if REGISTRY.rep(family):
         raise DefinitionError("'{}' already exixts".format(family))
 
     # Checks rep.
@@ -151,7 +766,7 @@ def addUnit(family: str, units: dict, unpacks: str = ""):
                 "invalid unit factor for '{}: {}'".format(u, units[u])
             )
 
-        if any([u in table[family] for family in table]):
+        if REGISTRY.convertible(u):
             raise DefinitionError(
                 "unit already defined in family '{}'".format(getFamily(u))
             )
@@ -176,6 +791,9 @@ def addUnit(family: str, units: dict, unpacks: str = ""):
         defined.DERIVED_TABLE[family] = {u: units[u] for u in units}
         defined.DERIVED_UNPACKING_TABLE[rep] = unpacks
 
+    # Invalidates the registry and every cache derived from the tables.
+    defined.generation += 1
+
 
 # QUANTITIES
 
@@ -969,3 +1587,224 @@ SI_DERIVED_UNPACKING_TABLE = {
 # CURRENCIES
 
 CURRENCIES_TABLE = {"currency": dict()}
+
+# ISO 4217 currency codes, known without loading any rate.
+CODES_TABLE = {
+    "AED",
+    "AFN",
+    "ALL",
+    "AMD",
+    "ANG",
+    "AOA",
+    "ARS",
+    "AUD",
+    "AWG",
+    "AZN",
+    "BAM",
+    "BBD",
+    "BDT",
+    "BGN",
+    "BHD",
+    "BIF",
+    "BMD",
+    "BND",
+    "BOB",
+    "BOV",
+    "BRL",
+    "BSD",
+    "BTN",
+    "BWP",
+    "BYN",
+    "BZD",
+    "CAD",
+    "CDF",
+    "CHE",
+    "CHF",
+    "CHW",
+    "CLF",
+    "CLP",
+    "CNY",
+    "COP",
+    "COU",
+    "CRC",
+    "CUC",
+    "CUP",
+    "CVE",
+    "CZK",
+    "DJF",
+    "DKK",
+    "DOP",
+    "DZD",
+    "EGP",
+    "ERN",
+    "ETB",
+    "EUR",
+    "FJD",
+    "FKP",
+    "GBP",
+    "GEL",
+    "GHS",
+    "GIP",
+    "GMD",
+    "GNF",
+    "GTQ",
+    "GYD",
+    "HKD",
+    "HNL",
+    "HTG",
+    "HUF",
+    "IDR",
+    "ILS",
+    "INR",
+    "IQD",
+    "IRR",
+    "ISK",
+    "JMD",
+    "JOD",
+    "JPY",
+    "KES",
+    "KGS",
+    "KHR",
+    "KMF",
+    "KPW",
+    "KRW",
+    "KWD",
+    "KYD",
+    "KZT",
+    "LAK",
+    "LBP",
+    "LKR",
+    "LRD",
+    "LSL",
+    "LYD",
+    "MAD",
+    "MDL",
+    "MGA",
+    "MKD",
+    "MMK",
+    "MNT",
+    "MOP",
+    "MRU",
+    "MUR",
+    "MVR",
+    "MWK",
+    "MXN",
+    "MXV",
+    "MYR",
+    "MZN",
+    "NAD",
+    "NGN",
+    "NIO",
+    "NOK",
+    "NPR",
+    "NZD",
+    "OMR",
+    "PAB",
+    "PEN",
+    "PGK",
+    "PHP",
+    "PKR",
+    "PLN",
+    "PYG",
+    "QAR",
+    "RON",
+    "RSD",
+    "RUB",
+    "RWF",
+    "SAR",
+    "SBD",
+    "SCR",
+    "SDG",
+    "SEK",
+    "SGD",
+    "SHP",
+    "SLE",
+    "SLL",
+    "SOS",
+    "SRD",
+    "SSP",
+    "STN",
+    "SVC",
+    "SYP",
+    "SZL",
+    "THB",
+    "TJS",
+    "TMT",
+    "TND",
+    "TOP",
+    "TRY",
+    "TTD",
+    "TWD",
+    "TZS",
+    "UAH",
+    "UGX",
+    "USD",
+    "USN",
+    "UYI",
+    "UYU",
+    "UYW",
+    "UZS",
+    "VED",
+    "VES",
+    "VND",
+    "VUV",
+    "WST",
+    "XAF",
+    "XAG",
+    "XAU",
+    "XBA",
+    "XBB",
+    "XBC",
+    "XBD",
+    "XCD",
+    "XCG",
+    "XDR",
+    "XOF",
+    "XPD",
+    "XPF",
+    "XPT",
+    "XSU",
+    "XUA",
+    "YER",
+    "ZAR",
+    "ZMW",
+    "ZWG",
+    "ZWL",
+}
+
+# ISO 4217 minor units, currencies not listed here have 2.
+MINOR_UNITS_TABLE = {
+    "BIF": 0,
+    "CLP": 0,
+    "DJF": 0,
+    "GNF": 0,
+    "ISK": 0,
+    "JPY": 0,
+    "KMF": 0,
+    "KRW": 0,
+    "PYG": 0,
+    "RWF": 0,
+    "UGX": 0,
+    "UYI": 0,
+    "VND": 0,
+    "VUV": 0,
+    "XAF": 0,
+    "XOF": 0,
+    "XPF": 0,
+    "BHD": 3,
+    "IQD": 3,
+    "JOD": 3,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "TND": 3,
+    "CLF": 4,
+    "UYW": 4,
+}
+
+# Serializes rates' loading.
+FETCHING = Lock()
+
+# REGISTRY
+
+REGISTRY = registry()
@@ -1,4 +1,5 @@
 # Utilities.
+from collections import OrderedDict
 from re import findall
 from typing import Any
 
@@ -29,10 +30,34 @@ def uAny(obj: Any) -> bool:
 
 
 def dictFromUnit(unit: str) -> dict:
+    """
+    Returns the dictionary of units from a properly formatted string.
+    """
+
+    return dict(parseUnit(unit).units)
+
+
+def parseUnit(unit: str) -> "signature":
+    """
+    Returns the signature of a properly formatted string.
+
+    Parsed signatures are cached, parsing a known string does no regex work.
+    """
+
+    parsed = SIGNATURES.get(unit)
+
+    if parsed is None:
+        parsed = signature(tuple(parseSymbols(unit).items()))
+        SIGNATURES.set(unit, parsed)
+
+    return parsed
+
+
+def parseSymbols(unit: str) -> dict:
     from .exceptions import UnitError
 
     """
-    Returns the dictionary of units from a properly formatted string.
+    Parses a properly formatted string into a dictionary of units.
     """
 
     units = dict()
@@ -78,3 +103,110 @@ def unitFromDict(units: dict) -> str:
             ]
         )
     )
+
+
+class signature:
+    """
+    Immutable parsed unit.
+
+    Holds the (symbol, power) pairs in definition order along with the
+    canonical unit string, on which equality and hashing are based.
+    """
+
+    __slots__ = ("units", "unit", "hash")
+
+    def __init__(self, units: tuple) -> None:
+        object.__setattr__(self, "units", units)
+        object.__setattr__(self, "unit", unitFromDict(dict(units)))
+        object.__setattr__(self, "hash", hash(self.unit))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("signatures are immutable")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, signature):
+            return NotImplemented
+
+        return self.unit == other.unit
+
+    def __hash__(self) -> int:
+        return self.hash
+
+    def __repr__(self) -> str:
+        return "signature('{}')".format(self.unit)
+
+    # COPYING AND PICKLING.
+
+    def __reduce__(self) -> tuple:
+        return (signature, (self.units,))
+
+    def __deepcopy__(self, memo: dict) -> "signature":
+        return self
+
+
+class cache:
+    """
+    Bounded least recently used cache with hit/miss statistics.
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        self.size: int = size
+        self.data: OrderedDict = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Returns the value cached for key, default if missing.
+        """
+
+        try:
+            value = self.data[key]
+            self.data.move_to_end(key)
+
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """
+        Caches value for key, evicting the least recently used entries.
+        """
+
+        self.data[key] = value
+        self.data.move_to_end(key)
+
+        while len(self.data) > self.size:
+            self.data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Empties the cache and resets its statistics.
+        """
+
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache's statistics.
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.data),
+            "maxsize": self.size,
+        }
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+# Parsed signatures' cache.
+SIGNATURES = cache(4096)
@@ -1,9 +1,25 @@
 # Test suite for misura.
 
+import asyncio
+from copy import deepcopy
+from decimal import Decimal
+from importlib.util import find_spec
+from os import chdir, getcwd, stat
+from os.path import join
+from pickle import dumps, loads
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import sleep, time
+
 from colorama import Style
-from misura.quantities import quantity, convert, unpack, pack
-from misura.tables import addUnit
-from misura.currencies import currency
+from misura.quantities import quantity, convert, unpack, pack, batchConvert
+from misura.tables import (
+    addUnit, getFamily, getRep, getCurrencies, lockFile, readRates, writeRates
+)
+from misura.utilities import parseUnit
+from misura.currencies import currency, preload, refresh, refresher
+from misura.globals import currencies
+from misura.providers import provider, stubProvider
 
 addUnit("bananas", {"bnn": 1, "dabnn": 10, "hbnn": 100, "kbnn": 1000})
 
@@ -23,6 +39,8 @@ num12 = quantity(2, "kg", 0.04)
 num13 = quantity(0.8, "m3", 0.16)
 num14 = quantity(3, "", 1)
 
+directory = TemporaryDirectory()
+
 print("Tests for {}.".format(Style.BRIGHT + "misura" + Style.RESET_ALL))
 
 # Dimensions.
@@ -42,6 +60,13 @@ print("({}) ** 0.5 < {}: {}".format(num0, num1, num0**0.5 < num1))
 print("{} < 0.02 * {}**2: {}".format(num0, num1, num0 < 0.02 * num1**2))
 print("{} == {}: {}".format(num1, num2, num1 == num2))
 print("{} != {}: {}".format(num1, num2, num1 != num2))
+print("1 kg < {}: {}".format(num12, quantity(1, "kg") < num12))
+
+try:
+    num1 > num2
+
+except Exception as error:
+    print("{} > {}: {}: {}".format(num1, num2, type(error).__name__, error))
 
 # Conversions.
 print("\nCONVERSIONS.\n")
@@ -49,6 +74,12 @@ print("({}) ** 0.5 + {}: {}".format(num0, num1, num0**0.5 + num1))
 print("{} to 'm': {}".format(num1, convert(num1, "m")))
 print("{} to 'mA', partial: {}".format(num2, convert(num2, "mA", partial=True)))
 
+try:
+    num1 + num2
+
+except Exception as error:
+    print("{} + {}: {}: {}".format(num1, num2, type(error).__name__, error))
+
 # Unpacking.
 print("\nUNPACKING.\n")
 print("{}: {}".format(num3, unpack(num3)))
@@ -70,11 +101,117 @@ print("{} packed to 'J', ignoring 'T': {}".format(num10, pack(num10, "J", ignore
 print("\nCUSTOM UNITS OF MEASURE.\n")
 print("{} to 'bnn': {}".format(num11, convert(num11, "bnn")))
 
+# Definitions after use.
+print("\nDEFINITIONS AFTER USE.\n")
+print("'kcrt' family, undefined: '{}'".format(getFamily("kcrt")))
+
+try:
+    convert(quantity(2, "kcrt"), "crt")
+
+except Exception as error:
+    print("2 kcrt to 'crt', undefined: {}".format(type(error).__name__))
+
+print("'kcrt crt-1' parsed, undefined: {}".format(parseUnit("kcrt crt-1").unit))
+
+addUnit("carrots", {"crt": 1, "kcrt": 1000})
+addUnit("crops", {"crp": 1}, "crt m-2")
+
+print("'kcrt' family: '{}'".format(getFamily("kcrt")))
+print("'carrots' reference: '{}'".format(getRep("carrots")))
+print("2 kcrt to 'crt': {}".format(convert(quantity(2, "kcrt"), "crt")))
+print("2 kcrt to 'crt', again: {}".format(convert(quantity(2, "kcrt"), "crt")))
+print("'kcrt crt-1' parsed: {}".format(parseUnit("kcrt crt-1").unit))
+print("2 kcrt + 3 crt: {}".format(quantity(2, "kcrt") + quantity(3, "crt")))
+print("2 kcrt > 3 crt: {}".format(quantity(2, "kcrt") > quantity(3, "crt")))
+print("3 kcrt crp unpacked: {}".format(unpack(quantity(3, "kcrt crp"))))
+print("3 kcrt m-2 packed to 'crp': {}".format(pack(quantity(3, "kcrt m-2"), "crp")))
+
 # Uncertainty.
 print("\nUNCERTAINTY.\n")
 print("({}) ** 2: {}".format(num12, num12**2))
 print("({}) / ({}): {}".format(num12, num13, num12 / num13))
 
+# Rates loading.
+print("\nRATES LOADING.\n")
+
+try:
+    quantity(2, "EUR")
+
+except Exception as error:
+    print("2 EUR as a quantity, not loaded: {}".format(type(error).__name__))
+
+print("Rates loaded on import: {}".format(bool(getCurrencies()["currency"])))
+
+preload()
+
+print("Rates loaded by preload(): {}".format(bool(getCurrencies()["currency"])))
+
+try:
+    quantity(2, "EUR")
+
+except Exception as error:
+    print("2 EUR as a quantity, loaded: {}".format(type(error).__name__))
+
+print("Rates valid until their expiry: {}".format(currencies.expiry > time()))
+
+asyncio.run(refresh())
+
+print("Rates refreshed in the background: {}".format(currencies.expiry > time()))
+
+
+async def background() -> bool:
+    task = asyncio.create_task(refresher())
+    await asyncio.sleep(0.1)
+    task.cancel()
+
+    return currencies.background
+
+
+print("Refresher running: {}".format(asyncio.run(background())))
+print("Refresher running after cancellation: {}".format(currencies.background))
+
+# Rates files.
+path0 = join(directory.name, "rates.json")
+writeRates(path0, {"time": time(), "rates": {"EUR": 0.5, "USD": 1.0}})
+
+print("\nRATES FILES.\n")
+print("Rates read back: {}".format(readRates(path0)["rates"]))
+print("Rates file mode: {}".format(oct(stat(path0).st_mode & 0o777)))
+
+cwd = getcwd()
+chdir(directory.name)
+writeRates("bare.json", {"time": time(), "rates": {"EUR": 0.5, "USD": 1.0}})
+chdir(cwd)
+
+print(
+    "Rates read back from a bare name: {}".format(
+        readRates(join(directory.name, "bare.json"))["rates"]
+    )
+)
+
+writeRates(path0, {"time": 0, "rates": {"EUR": 0.5, "USD": 1.0}})
+
+print("Stale rates read back: {}".format(readRates(path0)))
+
+# Lock holders, in order.
+holders = []
+
+
+def holder():
+    with lockFile(path0 + ".lock"):
+        holders.append("second")
+
+
+with lockFile(path0 + ".lock"):
+    thread = Thread(target=holder)
+    thread.start()
+    sleep(0.1)
+    holders.append("first")
+
+thread.join()
+
+print("Lock holders, in order: {}".format(holders))
+
 # Currencies.
 cur0 = currency(2, "EUR")
 cur1 = currency(3, "USD")
@@ -83,3 +220,182 @@ print("\nCURRENCIES.\n")
 print("({}) * 2: {}".format(cur0, cur0 * 2))
 print("({}) // 3: {}".format(cur1, cur1 // 3))
 print("({}) + ({}): {:.2f}".format(cur1, cur0, cur1 + cur0))
+
+# Providers.
+currencies.path = join(directory.name, "misura.json")
+currencies.provider = stubProvider(
+    {"EUR": 0.5, "USD": 1.0, "JPY": 150.0, "IRR": 42000.0, "KWD": 0.3}
+)
+
+print("\nPROVIDERS.\n")
+print("({}) to 'USD', stub rates: {}".format(cur0, cur0.cto("USD")))
+
+
+class partial(provider):
+    pass
+
+
+try:
+    partial()
+
+except Exception as error:
+    print("Provider without fetch: {}".format(type(error).__name__))
+
+# Signatures and powers.
+num15 = quantity(-2, "m", 0.1)
+num16 = quantity(500, "m s-1", 10)
+
+print("\nSIGNATURES AND POWERS.\n")
+print("({}) ** 2: {}".format(num15, num15**2))
+print("({}) * ({}): {}".format(num1, num16, num1 * num16))
+print("({}) / ({}): {}".format(num1, num16, num1 / num16))
+print("({}) / ({}) again: {}".format(num1, num16, num1 / num16))
+
+try:
+    num1 * num0
+
+except Exception as error:
+    print("({}) * ({}): {}: {}".format(num1, num0, type(error).__name__, error))
+
+# Pickling.
+print("\nPICKLING.\n")
+print("{} pickled: {}".format(num12, loads(dumps(num12))))
+print("{} pickled: {}".format(cur0, loads(dumps(cur0))))
+print("{} deep copied: {}".format(num16, deepcopy(num16)))
+
+# Optional numpy tests.
+if find_spec("numpy") is None:
+    print("\nnumpy is not installed, skipping the remaining tests.")
+    raise SystemExit
+
+import numpy as np
+from misura.ledgers import ledger, minorLedger
+from misura.history import rateHistory
+from misura.arrays import quantityArray
+from misura.correlations import correlated, correlation, covariance
+from misura.sampling import sampled, seed
+
+# Ledgers.
+led0 = ledger([2, 3, 5], ["EUR", "USD", "EUR"])
+led1 = minorLedger([1234, 500, 1000], ["EUR", "USD", "JPY"])
+led2 = minorLedger([10**12], ["IRR"])
+
+print("\nLEDGERS.\n")
+print("{} to 'USD': {}".format(led0, led0.convert("USD")))
+print("{} total in 'EUR': {}".format(led0, led0.total("EUR")))
+print("{} to 'USD', minor units: {}".format(led1, led1.convert("USD")))
+print("{} to 'KWD', minor units: {}".format(led2, led2.convert("KWD")))
+print("({}) + ({}): {}".format(led1[0], led1[1], led1[0] + led1[1]))
+
+# Historical rates.
+hst0 = rateHistory(join(directory.name, "history"))
+hst0.ingest({}, 0)
+hst0.ingest({"EUR": 0.9, "USD": 1.0}, 86400)
+hst0.ingest({"EUR": 0.8, "USD": 1.0, "JPY": 150.0}, 3 * 86400)
+hst0.ingest({"EUR": 0.9, "USD": 1.0}, 86400)
+
+print("\nHISTORICAL RATES.\n")
+print("{} as of '1970-01-03': {}".format(hst0, hst0.asof("1970-01-03")))
+print("{} as of '1970-01-04': {}".format(hst0, hst0.asof("1970-01-04")))
+print(
+    "{} to 'USD' as of '1970-01-02' and '1970-01-05': {}".format(
+        led0[:2], hst0.convert(led0[:2], ["1970-01-02", "1970-01-05"], "USD")
+    )
+)
+
+# Orphan timestamp from an interrupted append.
+with open(hst0.times.filename, "ab") as file:
+    file.write(np.float64(5 * 86400).tobytes())
+
+hst0.ingest({"EUR": 0.7, "USD": 1.0}, 6 * 86400)
+
+print("{} as of '1970-01-06': {}".format(hst0, hst0.asof("1970-01-06")))
+print("{} as of '1970-01-07': {}".format(hst0, hst0.asof("1970-01-07")))
+
+# Arrays.
+arr0 = quantityArray([1.0, 2.0, 4.0, 7.0], "m", 0.1)
+arr1 = quantityArray([1.0, 2.0], "km")
+
+print("\nARRAYS.\n")
+print("{} + {}: {}".format(arr0, num1, arr0 + num1))
+print("{} * {}: {}".format(arr1, num12, arr1 * num12))
+print("sqrt({}): {}".format(arr0, np.sqrt(arr0)))
+print("{} > 1500 m: {}".format(arr1, arr1 > quantity(1500, "m")))
+
+try:
+    arr1 * quantityArray([1.0, 2.0], "m2")
+
+except Exception as error:
+    print("{}: {}".format(type(error).__name__, error))
+print("{} pickled: {}".format(arr0, loads(dumps(arr0))))
+print("{} deep copied: {}".format(arr0, deepcopy(arr0)))
+
+# Array functions.
+print("\nARRAY FUNCTIONS.\n")
+print("sum({}): {}".format(arr0, np.sum(arr0)))
+print("mean({}): {}".format(arr0, np.mean(arr0)))
+print("std({}): {}".format(arr0, np.std(arr0)))
+print("diff({}), prepending 0 m: {}".format(arr0, np.diff(arr0, prepend=0 * num1)))
+print("concatenate({}, {}): {}".format(arr0, arr1, np.concatenate([arr0, arr1])))
+
+# Value kinds.
+num17 = quantity(Decimal("1.5"), "km", Decimal("0.1"))
+num18 = quantity(np.array([1.0, 2.0]), "m", np.array([0.1, 0.2]))
+
+print("\nVALUE KINDS.\n")
+print("{} to 'm': {}".format(num17, num17.cto("m")))
+print("({}) * ({}): {}".format(num17, num17, num17 * num17))
+print("({}) * ({}): {}".format(num18, num12, num18 * num12))
+
+# Correlations.
+crl0 = correlated(2, "m", 0.1)
+crl1 = correlated(3, "m", 0.2)
+
+print("\nCORRELATIONS.\n")
+print("({}) - ({}): {}".format(crl0, crl0, crl0 - crl0))
+print("({}) - ({}) + ({}): {}".format(num0**0.5, crl0, crl0, num0**0.5 - crl0 + crl0))
+print("({}) / ({}) * ({}): {}".format(num1, crl0, crl0, num1 / crl0 * crl0))
+print(
+    "covariance of ({}) * ({}) and ({}):\n{}".format(
+        crl0, crl1, crl0, covariance(crl0 * crl1, crl0)
+    )
+)
+print(
+    "correlation of ({}) and ({}) to 'km':\n{}".format(
+        crl0, crl0, correlation(crl0, crl0.cto("km"))
+    )
+)
+
+# Sampling.
+seed(0)
+smp0 = sampled(2, "m", 0.1)
+smp1 = smp0**2
+
+print("\nSAMPLING.\n")
+print("({}) ** 2: {:.2f} ± {:.2f}".format(smp0, smp1.value, smp1.uncertainty))
+print(
+    "({}) ** 2, 95% interval: {:.2f}, {:.2f}".format(
+        smp0, *[bound.value for bound in smp1.interval(0.95)]
+    )
+)
+print("({}) ** 0: {}".format(smp0, smp0**0))
+print("({}) * {}: {}".format(smp0, arr1, smp0 * arr1))
+
+# Batch conversion.
+items0 = [num1, quantity(3, "cm", 0.1), quantity(2, "mm")]
+
+print("\nBATCH CONVERSION.\n")
+print("{} to 'm': {}".format(items0, batchConvert(items0, "m")))
+print("{} to 'm', array: {}".format(items0, batchConvert(items0, "m", array=True)))
+print(
+    "[{}, {}] to 'km', covariance:\n{}".format(
+        crl0, crl0, covariance(*batchConvert([crl0, crl0], "km"))
+    )
+)
+print("[] to 'm', array: {}".format(batchConvert([], "m", array=True)))
+
+try:
+    batchConvert([num1, quantity(3, "s")], "m")
+
+except Exception as error:
+    print("[{}, 3 s] to 'm': {}: {}".format(num1, type(error).__name__, error))